@@ -0,0 +1,319 @@
+from array import array
+from operator import add
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_INT64_MAX = (1 << 63) - 1
+
+
+def grid_typecode(grid):
+    # 'd' if any cell is a float, 'q' for 64-bit ints, None when only a plain list will do
+    typecode = 'q'
+    for row in grid:
+        for value in row:
+            if isinstance(value, float):
+                typecode = 'd'
+            elif not isinstance(value, int) or not -_INT64_MAX - 1 <= value <= _INT64_MAX:
+                return None
+    return typecode
+
+
+def make_buffer(typecode, size):
+    if typecode is None:
+        return [0] * size
+    return array(typecode, [0]) * size
+
+
+def row_values(typecode, row):
+    return list(row) if typecode is None else array(typecode, row)
+
+
+def grid_shape(grid):
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+    if rows == 0 or cols == 0:
+        raise ValueError("grid must be non-empty")
+    return rows, cols
+
+
+class Fenwick2D:
+    # 2-D binary indexed tree for point updates and rectangle sums.
+    # One contiguous buffer of (rows + 1) * (cols + 1) cells, 1-based. The cells are
+    # partial sums, so they can outgrow int64 while every value fits; the buffer then
+    # becomes a plain list (untype).
+    def __init__(self, grid, typecode=None):
+        self.rows, self.cols = grid_shape(grid)
+        self.typecode = typecode or grid_typecode(grid)
+        self.width = self.cols + 1
+        self.tree = make_buffer(self.typecode, (self.rows + 1) * self.width)
+        self.build(grid)
+
+    def untype(self):
+        self.typecode = None
+        self.tree = self.tree.tolist()
+
+    def build(self, grid):
+        # O(rows * cols): push every cell into its parent along columns, then along rows
+        rows, cols, width = self.rows, self.cols, self.width
+        for r in range(rows):
+            base = (r + 1) * width
+            self.tree[base + 1:base + width] = row_values(self.typecode, grid[r])
+        # No partial sum exceeds the sum of all |cells|; NumPy would wrap silently past int64
+        if self.typecode == 'q' and sum(map(abs, self.tree)) > _INT64_MAX:
+            self.untype()
+        tree = self.tree
+        if np is not None and self.typecode is not None:
+            view = np.frombuffer(tree, dtype=self.typecode).reshape(rows + 1, width)
+            for c in range(1, cols + 1):
+                parent = c + (c & -c)
+                if parent <= cols:
+                    view[:, parent] += view[:, c]
+            for r in range(1, rows + 1):
+                parent = r + (r & -r)
+                if parent <= rows:
+                    view[parent] += view[r]
+            return
+        for r in range(1, rows + 1):
+            base = r * width
+            for c in range(1, cols + 1):
+                parent = c + (c & -c)
+                if parent <= cols:
+                    tree[base + parent] += tree[base + c]
+        for r in range(1, rows + 1):
+            parent = r + (r & -r)
+            if parent <= rows:
+                src, dst = r * width, parent * width
+                for c in range(1, cols + 1):
+                    tree[dst + c] += tree[src + c]
+
+    def add(self, r, c, delta):
+        # grid[r][c] += delta
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError("cell out of bounds")
+        tree, width = self.tree, self.width
+        i = r + 1
+        while i <= self.rows:
+            base = i * width
+            j = c + 1
+            while j <= self.cols:
+                try:
+                    tree[base + j] += delta
+                except (OverflowError, TypeError):
+                    # A rejected write leaves the cell unchanged: untype and redo this cell
+                    if self.typecode is None:
+                        raise
+                    self.untype()
+                    tree = self.tree
+                    continue
+                j += j & -j
+            i += i & -i
+
+    def prefix_sum(self, r, c):
+        # Sum of grid[0 .. r - 1][0 .. c - 1]
+        tree, width = self.tree, self.width
+        total = 0
+        i = r
+        while i > 0:
+            base = i * width
+            j = c
+            while j > 0:
+                total += tree[base + j]
+                j -= j & -j
+            i -= i & -i
+        return total
+
+    def query(self, r1, c1, r2, c2):
+        # Sum of the rectangle with corners (r1, c1) and (r2, c2), inclusive
+        if not (0 <= r1 <= r2 < self.rows and 0 <= c1 <= c2 < self.cols):
+            raise IndexError("rectangle out of bounds")
+        return (self.prefix_sum(r2 + 1, c2 + 1) - self.prefix_sum(r1, c2 + 1)
+                - self.prefix_sum(r2 + 1, c1) + self.prefix_sum(r1, c1))
+
+    def update(self, r, c, value):
+        # grid[r][c] = value
+        self.add(r, c, value - self.query(r, c, r, c))
+
+
+class SegmentTree2D:
+    # Bottom-up 2-D segment tree for rectangle queries with any associative,
+    # commutative combine (max, min, sum, ...). One contiguous buffer of
+    # (2 * rows) x (2 * cols) cells: node (i, j) lives at tree[i * 2 * cols + j].
+    def __init__(self, grid, combine=max, identity=float('-inf'), typecode=None):
+        self.rows, self.cols = grid_shape(grid)
+        self.combine = combine
+        self.identity = identity
+        self.typecode = typecode or grid_typecode(grid)
+        self.width = 2 * self.cols
+        self.tree = make_buffer(self.typecode, 2 * self.rows * self.width)
+        self.build(grid)
+
+    def untype(self):
+        self.typecode = None
+        self.tree = self.tree.tolist()
+
+    def _widening(self, write, *args):
+        # Run write; if the typed buffer rejects a value (a sum past int64, a float in an
+        # int grid), untype and run it again. build and update only assign, so a rerun is safe.
+        try:
+            write(*args)
+        except (OverflowError, TypeError):
+            if self.typecode is None:
+                raise
+            self.untype()
+            write(*args)
+
+    def build(self, grid):
+        self._widening(self._build, grid)
+
+    def _build(self, grid):
+        rows, cols, width, tree, combine = self.rows, self.cols, self.width, self.tree, self.combine
+        # Leaf rows: fill the leaves, then build each row as a 1-D tree
+        for r in range(rows):
+            base = (rows + r) * width
+            tree[base + cols:base + width] = row_values(self.typecode, grid[r])
+            for j in range(cols - 1, 0, -1):
+                tree[base + j] = combine(tree[base + 2 * j], tree[base + 2 * j + 1])
+        # Internal rows: combine the two child rows cell by cell
+        for i in range(rows - 1, 0, -1):
+            base, top, bottom = i * width, 2 * i * width, (2 * i + 1) * width
+            for j in range(1, width):
+                tree[base + j] = combine(tree[top + j], tree[bottom + j])
+
+    def _query_row(self, base, c1, c2):
+        tree, combine = self.tree, self.combine
+        result = self.identity
+        l = c1 + self.cols
+        r = c2 + self.cols + 1
+        while l < r:
+            if l & 1:
+                result = combine(result, tree[base + l])
+                l += 1
+            if r & 1:
+                r -= 1
+                result = combine(result, tree[base + r])
+            l >>= 1
+            r >>= 1
+        return result
+
+    def query(self, r1, c1, r2, c2):
+        # Combine over the rectangle with corners (r1, c1) and (r2, c2), inclusive
+        if not (0 <= r1 <= r2 < self.rows and 0 <= c1 <= c2 < self.cols):
+            raise IndexError("rectangle out of bounds")
+        combine, width = self.combine, self.width
+        result = self.identity
+        l = r1 + self.rows
+        r = r2 + self.rows + 1
+        while l < r:
+            if l & 1:
+                result = combine(result, self._query_row(l * width, c1, c2))
+                l += 1
+            if r & 1:
+                r -= 1
+                result = combine(result, self._query_row(r * width, c1, c2))
+            l >>= 1
+            r >>= 1
+        return result
+
+    def update(self, r, c, value):
+        # grid[r][c] = value
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError("cell out of bounds")
+        self._widening(self._set, r, c, value)
+
+    def _set(self, r, c, value):
+        tree, combine, width = self.tree, self.combine, self.width
+        i = r + self.rows
+        base = i * width
+        j = c + self.cols
+        tree[base + j] = value
+        j >>= 1
+        while j:
+            tree[base + j] = combine(tree[base + 2 * j], tree[base + 2 * j + 1])
+            j >>= 1
+        i >>= 1
+        while i:
+            base, top, bottom = i * width, 2 * i * width, (2 * i + 1) * width
+            j = c + self.cols
+            while j:
+                tree[base + j] = combine(tree[top + j], tree[bottom + j])
+                j >>= 1
+            i >>= 1
+
+
+class SummedAreaTable:
+    # Static rectangle sums in O(1). sat[r][c] is the sum of grid[0 .. r - 1][0 .. c - 1],
+    # built with two NumPy cumulative sums. For grids that never change. Integer grids
+    # whose sums could pass int64 are summed as Python ints (object dtype) instead of wrapping.
+    def __init__(self, grid):
+        if np is None:
+            raise ImportError("SummedAreaTable needs NumPy")
+        values = np.asarray(grid)
+        if values.ndim != 2 or values.size == 0:
+            raise ValueError("grid must be a non-empty 2-D array")
+        if values.dtype.kind in 'biu':
+            if np.abs(values.astype(np.float64)).sum() >= 2.0 ** 62:
+                values = values.astype(object)
+            else:
+                values = values.astype(np.int64)
+        self.rows, self.cols = values.shape
+        self.sat = np.zeros((self.rows + 1, self.cols + 1), dtype=values.dtype)
+        np.cumsum(values, axis=0, out=self.sat[1:, 1:])
+        np.cumsum(self.sat[1:, 1:], axis=1, out=self.sat[1:, 1:])
+
+    def query(self, r1, c1, r2, c2):
+        # Sum of the rectangle with corners (r1, c1) and (r2, c2), inclusive
+        if not (0 <= r1 <= r2 < self.rows and 0 <= c1 <= c2 < self.cols):
+            raise IndexError("rectangle out of bounds")
+        sat = self.sat
+        total = sat[r2 + 1, c2 + 1] - sat[r1, c2 + 1] - sat[r2 + 1, c1] + sat[r1, c1]
+        return total.item() if isinstance(total, np.generic) else total
+
+    def query_many(self, r1, c1, r2, c2):
+        # Vectorized query over arrays of corners; returns a NumPy array
+        r1, c1, r2, c2 = (np.asarray(a, dtype=np.int64) for a in (r1, c1, r2, c2))
+        if not r1.shape == c1.shape == r2.shape == c2.shape:
+            raise ValueError("corner arrays must have the same length")
+        # NumPy would wrap negative indices around instead of failing, so check like query does
+        if r1.size and (r1.min() < 0 or r2.max() >= self.rows or (r1 > r2).any()
+                        or c1.min() < 0 or c2.max() >= self.cols or (c1 > c2).any()):
+            raise IndexError("rectangle out of bounds")
+        sat = self.sat
+        return sat[r2 + 1, c2 + 1] - sat[r1, c2 + 1] - sat[r2 + 1, c1] + sat[r1, c1]
+
+
+def rectangle_sum_structure(grid, immutable=False):
+    # O(1) summed-area table for static grids, Fenwick2D when cells will be updated
+    if immutable and np is not None:
+        return SummedAreaTable(grid)
+    return Fenwick2D(grid)
+
+
+# Example usage
+if __name__ == "__main__":
+    grid = [
+        [3, 0, 1, 4],
+        [5, 6, 3, 2],
+        [1, 2, 0, 1],
+        [4, 1, 0, 1],
+    ]
+
+    sums = Fenwick2D(grid)
+    print("Sum of (1,1)-(2,2):", sums.query(1, 1, 2, 2))  # Output: 11
+    sums.update(2, 2, 10)
+    print("After update:", sums.query(1, 1, 2, 2))  # Output: 21
+
+    maxes = SegmentTree2D(grid)
+    print("Max of (2,0)-(3,3):", maxes.query(2, 0, 3, 3))  # Output: 4
+    maxes.update(3, 3, 9)
+    print("After update:", maxes.query(2, 0, 3, 3))  # Output: 9
+
+    static = rectangle_sum_structure(grid, immutable=True)
+    print("Static sum of (0,0)-(3,3):", static.query(0, 0, 3, 3))  # Output: 34
+
+    min_tree = SegmentTree2D(grid, min, float('inf'))
+    sum_tree = SegmentTree2D(grid, add, 0)
+    print("Min / sum of (0,0)-(1,3):", min_tree.query(0, 0, 1, 3), sum_tree.query(0, 0, 1, 3))  # Output: 0 24
@@ -1,8 +1,4 @@
-class TreeNode:
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
+from nodes import TreeNode
 
 # Step 1: Perform an inorder traversal to store the BST elements in a sorted list
 def inorder_traversal(root, nodes):
@@ -1,8 +1,4 @@
-class TreeNode:
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
+from nodes import TreeNode
 
 class BSTModifier:
     def delete_node(self, root, key):
@@ -35,4 +31,20 @@ class BSTModifier:
         """Finds the inorder successor (smallest node in right subtree)"""
         while node.left:
             node = node.left
-        return node
\ No newline at end of file
+        return node
+
+
+# Example usage
+if __name__ == "__main__":
+    def inorder(node):
+        return inorder(node.left) + [node.val] + inorder(node.right) if node else []
+
+    #        5
+    #       / \
+    #      3   8
+    #     / \   \
+    #    2   4   9
+    root = TreeNode(5, TreeNode(3, TreeNode(2), TreeNode(4)), TreeNode(8, None, TreeNode(9)))
+    root = BSTModifier().delete_node(root, 3)
+    print(inorder(root))  # Output: [2, 4, 5, 8, 9]
+    print(root.left.val)  # Output: 4
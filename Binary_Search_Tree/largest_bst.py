@@ -1,8 +1,4 @@
-class TreeNode:
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
+from nodes import TreeNode
 
 class BSTInfo:
     def __init__(self, is_bst, size, min_val, max_val):
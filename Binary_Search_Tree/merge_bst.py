@@ -1,8 +1,4 @@
-class TreeNode:
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
+from nodes import TreeNode
 
 def inorderTraversal(root):
     result = []
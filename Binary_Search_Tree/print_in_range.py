@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, key):
-        self.left = None
-        self.right = None
-        self.val = key
+from nodes import TreeNode as Node
 
 def print_in_range(root, start, end):
     if not root:
@@ -1,8 +1,12 @@
-class Node:
-    def __init__(self, key):
+from nodes import BinaryNode
+
+class Node(BinaryNode):
+    __slots__ = ('key',)
+
+    def __init__(self, key, left=None, right=None):
         self.key = key
-        self.left = None
-        self.right = None
+        self.left = left
+        self.right = right
 
 def search(root, key):
     if root is None or root.key == key:
@@ -1,8 +1,12 @@
-class Node:
-    def __init__(self, value):
+from nodes import BinaryNode
+
+class Node(BinaryNode):
+    __slots__ = ('value',)
+
+    def __init__(self, value, left=None, right=None):
         self.value = value
-        self.left = None
-        self.right = None
+        self.left = left
+        self.right = right
 
 def insert(root, value):
     if root is None:
@@ -20,5 +24,6 @@ def build_bst(arr):
     return root
 
 # Example usage
-arr = [10, 5, 15, 3, 7, 13, 18]
-bst_root = build_bst(arr)
\ No newline at end of file
+if __name__ == "__main__":
+    arr = [10, 5, 15, 3, 7, 13, 18]
+    bst_root = build_bst(arr)
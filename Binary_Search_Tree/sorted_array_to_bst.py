@@ -1,8 +1,4 @@
-class TreeNode:
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
+from nodes import TreeNode
 
 def sorted_array_to_bst(arr):
     if not arr:
@@ -1,8 +1,4 @@
-class Node:
-    def __init__(self, key):
-        self.left = None
-        self.right = None
-        self.val = key
+from nodes import TreeNode as Node
 
 def is_valid_bst(root, min_val=float('-inf'), max_val=float('inf')):
     if not root:
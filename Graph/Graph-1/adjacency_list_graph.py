@@ -1,24 +1,46 @@
 class Graph:
-    def __init__(self):
+    def __init__(self, directed=False):
         self.adj_list = {}
+        self.weights = {} #weights[u][i] is the weight of the edge to adj_list[u][i]
+        self.directed = directed
+        self.weighted = False
     
-    def add_edge(self,u,v):
+    def add_edge(self,u,v,weight=1):
         if u not in self.adj_list:
             self.adj_list[u] = []
+            self.weights[u] = []
         if v not in self.adj_list:
             self.adj_list[v] = []
+            self.weights[v] = []
+        if weight != 1:
+            self.weighted = True
         self.adj_list[u].append(v)
-        self.adj_list[v].append(u)
+        self.weights[u].append(weight)
+        if not self.directed:
+            self.adj_list[v].append(u)
+            self.weights[v].append(weight)
     
     def display(self):
         for node in self.adj_list:
-            print(node,":",self.adj_list[node])
+            if self.weighted:
+                print(node,":",list(zip(self.adj_list[node],self.weights[node])))
+            else:
+                print(node,":",self.adj_list[node])
 
 # Example Usage
-graph = Graph()
-graph.add_edge(1, 2)
-graph.add_edge(1, 3)
-graph.add_edge(2, 4)
-graph.add_edge(3, 4)
+if __name__ == "__main__":
+    graph = Graph()
+    graph.add_edge(1, 2)
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 4)
+    graph.add_edge(3, 4)
 
-graph.display()
\ No newline at end of file
+    graph.display()
+
+    # Weighted, directed graph
+    roads = Graph(directed=True)
+    roads.add_edge(1, 2, 7)
+    roads.add_edge(1, 3, 2)
+    roads.add_edge(3, 2, 3)
+
+    roads.display()
@@ -1,24 +1,36 @@
 class Graph:
-    def __init__(self,size):
+    def __init__(self,size,directed=False):
         self.size = size
-        self.matrix = [[0]*size for _ in range(size)]
+        self.directed = directed
+        self.matrix = [[0]*size for _ in range(size)] #0 means no edge, otherwise the edge weight
 
-    def add_edge(self,u,v):
-        self.matrix[u][v] = 1
+    def add_edge(self,u,v,weight=1):
+        if weight == 0:
+            raise ValueError("weight 0 cannot be stored: a 0 cell means no edge")
+        self.matrix[u][v] = weight
 
-        self.matrix[v][u] = 1
+        if not self.directed:
+            self.matrix[v][u] = weight
     
     def display(self):
         for row in self.matrix:
             print(row)
 
 # Example Usage
-graph = Graph(5)  # 5 nodes (0 to 4)
-graph.add_edge(0, 1)
-graph.add_edge(0, 2)
-graph.add_edge(1, 3)
-graph.add_edge(2, 3)
-graph.add_edge(3, 4)
+if __name__ == "__main__":
+    graph = Graph(5)  # 5 nodes (0 to 4)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 3)
+    graph.add_edge(3, 4)
 
-graph.display()
+    graph.display()
 
+    # Weighted, directed graph
+    roads = Graph(3, directed=True)
+    roads.add_edge(0, 1, 7)
+    roads.add_edge(0, 2, 2)
+    roads.add_edge(2, 1, 3)
+
+    roads.display()
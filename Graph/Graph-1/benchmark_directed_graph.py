@@ -0,0 +1,157 @@
+import sys
+import threading
+import time
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from directed_graph import strongly_connected_components, topological_sort
+
+
+def recursive_topological_sort(adj, n):
+    # Baseline: reverse DFS postorder with the recursive dfs pattern from dfs_traversal_graph
+    visited = bytearray(n)
+    postorder = []
+
+    def dfs(u):
+        visited[u] = 1
+        for v in adj[u]:
+            if not visited[v]:
+                dfs(v)
+        postorder.append(u)
+
+    for u in range(n):
+        if not visited[u]:
+            dfs(u)
+    postorder.reverse()
+    return postorder
+
+
+def recursive_tarjan(adj, n):
+    # Baseline: textbook recursive Tarjan; returns the number of components
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    state = [0, 0]  # next index, components found
+
+    def visit(u):
+        index[u] = low[u] = state[0]
+        state[0] += 1
+        stack.append(u)
+        on_stack[u] = 1
+        for v in adj[u]:
+            if index[v] < 0:
+                visit(v)
+                low[u] = min(low[u], low[v])
+            elif on_stack[v]:
+                low[u] = min(low[u], index[v])
+        if low[u] == index[u]:
+            while True:
+                w = stack.pop()
+                on_stack[w] = 0
+                if w == u:
+                    break
+            state[1] += 1
+
+    for u in range(n):
+        if index[u] < 0:
+            visit(u)
+    return state[1]
+
+
+def with_deep_stack(fn, *args):
+    # Run fn in a thread with a large C stack and recursion limit, the usual workaround
+    # the recursive versions need; returns (result, seconds) or (error, seconds)
+    box = []
+
+    def target():
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except RecursionError as error:
+            result = error
+        box.append((result, time.perf_counter() - start))
+
+    limit = sys.getrecursionlimit()
+    threading.stack_size(512 * 1024 * 1024)
+    sys.setrecursionlimit(max(limit, 2 * args[-1] + 100))
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        sys.setrecursionlimit(limit)
+        threading.stack_size(0)
+    return box[0]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def random_dag(n, avg_degree, seed=1):
+    # Edges always go from a smaller to a larger position of a random permutation
+    rng = np.random.default_rng(seed)
+    m = n * avg_degree
+    ends = np.sort(rng.integers(0, n, size=(m, 2)), axis=1)
+    ends = ends[ends[:, 0] != ends[:, 1]]
+    labels = rng.permutation(n)
+    return CSRGraph.from_edges(labels[ends], n=n, directed=True)
+
+
+def random_digraph(n, avg_degree, seed=1):
+    rng = np.random.default_rng(seed)
+    return CSRGraph.from_edges(rng.integers(0, n, size=(n * avg_degree, 2)), n=n, directed=True)
+
+
+def run(n, avg_degree):
+    dag = random_dag(n, avg_degree)
+    digraph = random_digraph(n, avg_degree)
+    dag_adj = dag.to_adjacency_list()
+    digraph_adj = digraph.to_adjacency_list()
+    print(f"n = {n:,}, arcs = {len(dag.targets):,} (DAG) / {len(digraph.targets):,} (random)")
+    print(f"{'task':<34}{'seconds':>10}")
+
+    order, seconds = timed(topological_sort, dag)
+    print(f"{'topological_sort (Kahn, CSR)':<34}{seconds:>10.3f}")
+    baseline, seconds = with_deep_stack(recursive_topological_sort, dag_adj, n)
+    print(f"{'recursive dfs toposort (dict)':<34}{seconds:>10.3f}")
+    position = np.empty(n, dtype=np.int64)
+    position[np.frombuffer(order, dtype=np.int64)] = np.arange(n)
+    offsets = np.frombuffer(dag.offsets, dtype=np.int64)
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    assert (position[sources] < position[np.frombuffer(dag.targets, dtype=np.int64)]).all()
+
+    (count, _), seconds = timed(strongly_connected_components, digraph)
+    print(f"{'strongly_connected_components':<34}{seconds:>10.3f}")
+    baseline, seconds = with_deep_stack(recursive_tarjan, digraph_adj, n)
+    print(f"{'recursive Tarjan (dict)':<34}{seconds:>10.3f}")
+    assert baseline == count
+    print(f"components: {count:,}")
+    print()
+
+
+def run_chain(n):
+    # A single path is the worst case for recursion depth
+    ends = np.arange(n, dtype=np.int64)
+    chain = CSRGraph.from_edges(np.column_stack((ends[:-1], ends[1:])), n=n, directed=True)
+    print(f"path of {n:,} nodes")
+    (count, _), seconds = timed(strongly_connected_components, chain)
+    print(f"{'strongly_connected_components':<34}{seconds:>10.3f}  ({count:,} components)")
+    order, seconds = timed(topological_sort, chain)
+    print(f"{'topological_sort':<34}{seconds:>10.3f}")
+    try:
+        recursive_tarjan(chain.to_adjacency_list(), n)
+        print("recursive Tarjan finished")
+    except RecursionError:
+        print(f"recursive Tarjan: RecursionError at the default limit of {sys.getrecursionlimit():,}")
+    print()
+
+
+if __name__ == "__main__":
+    for n in (100_000, 1_000_000):
+        run(n, 4)
+    run_chain(10_000_000)
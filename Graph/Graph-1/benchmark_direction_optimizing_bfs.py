@@ -0,0 +1,57 @@
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from bfs_traversal_graph import bfs
+from csr_graph import CSRGraph
+from direction_optimizing_bfs import direction_optimizing_bfs, top_down_bfs
+
+
+def power_law_graph(n, avg_degree, exponent=2.1, seed=1):
+    # Chung-Lu style: endpoints drawn with probability proportional to i^(-1 / (exponent - 1))
+    rng = np.random.default_rng(seed)
+    weights = np.arange(1, n + 1, dtype=np.float64) ** (-1.0 / (exponent - 1))
+    weights /= weights.sum()
+    m = n * avg_degree // 2
+    edges = rng.choice(n, size=(m, 2), p=weights)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    # Shuffle labels so the hubs are not simply the low ids
+    labels = rng.permutation(n)
+    return CSRGraph.from_edges(labels[edges], n=n)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run(n, avg_degree):
+    graph = power_law_graph(n, avg_degree)
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    start = int(np.argmax(np.diff(offsets)))
+    adj = graph.to_adjacency_list()
+
+    # The existing bfs looks at every neighbor of every node it reaches
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, bfs_time = timed(lambda: bfs(adj, start))
+    (do_parent, do_distance, do_checked), do_time = timed(lambda: direction_optimizing_bfs(graph, start))
+    (td_parent, td_distance, td_checked), td_time = timed(lambda: top_down_bfs(graph, start))
+    reached = do_distance >= 0
+    bfs_checked = int(np.diff(offsets)[reached].sum())
+
+    assert (do_distance == td_distance).all()
+    print(f"n = {n:,}, arcs = {len(graph.targets):,}, reached = {int(reached.sum()):,}")
+    print(f"{'variant':<26}{'edge checks':>14}{'seconds':>10}")
+    print(f"{'bfs (dict, prints)':<26}{bfs_checked:>14,}{bfs_time:>10.3f}")
+    print(f"{'top_down_bfs (NumPy)':<26}{td_checked:>14,}{td_time:>10.3f}")
+    print(f"{'direction_optimizing_bfs':<26}{do_checked:>14,}{do_time:>10.3f}")
+    print(f"edge checks saved vs bfs: {1 - do_checked / bfs_checked:.1%}")
+    print()
+
+
+if __name__ == "__main__":
+    for n in (100_000, 1_000_000):
+        run(n, 16)
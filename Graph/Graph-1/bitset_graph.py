@@ -0,0 +1,134 @@
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def popcount(x):
+        return bin(x).count('1')
+
+
+class BitsetGraph:
+    # Adjacency matrix with one Python int per row: bit v of rows[u] is set when u -> v.
+    # n x n cells take n * n / 8 bytes (a 20k-node graph is ~50 MB instead of gigabytes of lists),
+    # and set operations over a whole row run a machine word (64 cells) at a time.
+    # Unweighted; nodes are 0 .. size-1 like adjacency_matrix_graph.Graph.
+    def __init__(self, size, directed=False):
+        self.size = size
+        self.directed = directed
+        self.rows = [0] * size
+
+    @classmethod
+    def from_matrix_graph(cls, graph):
+        # Any nonzero cell of an adjacency_matrix_graph.Graph becomes an edge
+        bits = cls(graph.size, graph.directed)
+        for u, row in enumerate(graph.matrix):
+            bits.rows[u] = int(''.join('1' if cell else '0' for cell in reversed(row)) or '0', 2)
+        return bits
+
+    def add_edge(self, u, v):
+        self.rows[u] |= 1 << v
+        if not self.directed:
+            self.rows[v] |= 1 << u
+
+    def remove_edge(self, u, v):
+        self.rows[u] &= ~(1 << v)
+        if not self.directed:
+            self.rows[v] &= ~(1 << u)
+
+    def has_edge(self, u, v):
+        return (self.rows[u] >> v) & 1 == 1
+
+    def degree(self, u):
+        return popcount(self.rows[u])
+
+    def neighbors(self, u):
+        # Set bits of row u in increasing order; each step clears the lowest set bit
+        row = self.rows[u]
+        while row:
+            low = row & -row
+            yield low.bit_length() - 1
+            row ^= low
+
+    def common_neighbors(self, u, v):
+        return popcount(self.rows[u] & self.rows[v])
+
+    def triangle_count(self):
+        # Undirected: every triangle u < v < w is counted once at its smallest edge (u, v)
+        # by the bits above v in rows[u] & rows[v]
+        rows = self.rows
+        total = 0
+        for u in range(self.size):
+            row = rows[u] >> (u + 1)
+            base = u + 1
+            while row:
+                low = row & -row
+                v = base + low.bit_length() - 1
+                row ^= low
+                total += popcount((rows[u] & rows[v]) >> (v + 1))
+        return total
+
+    def node_triangles(self, u):
+        # Triangles through u: each edge between two neighbors of u, counted twice.
+        # Self-loops are masked out so they never close a triangle.
+        rows = self.rows
+        mask = rows[u] & ~(1 << u)
+        total = 0
+        for v in self.neighbors(u):
+            if v != u:
+                total += popcount(rows[v] & mask & ~(1 << v))
+        return total // 2
+
+    def reachable(self, u):
+        # Bitmask of every node reachable from u (u included), one whole frontier per step
+        seen = frontier = 1 << u
+        rows = self.rows
+        while frontier:
+            step = 0
+            while frontier:
+                low = frontier & -frontier
+                step |= rows[low.bit_length() - 1]
+                frontier ^= low
+            frontier = step & ~seen
+            seen |= frontier
+        return seen
+
+    def transitive_closure(self):
+        # Warshall's algorithm with rows as bitsets: once k is a known step, any row that
+        # reaches k ORs in everything k reaches. O(n^3 / 64) word operations.
+        closure = list(self.rows)
+        for k in range(self.size):
+            bit = 1 << k
+            reach = closure[k]
+            if not reach:
+                continue
+            for i in range(self.size):
+                if closure[i] & bit:
+                    closure[i] |= reach
+        result = BitsetGraph(self.size, directed=True)
+        result.rows = closure
+        return result
+
+    def display(self):
+        for row in self.rows:
+            print(format(row, '0{}b'.format(self.size))[::-1] if self.size else '')
+
+
+# Example Usage
+if __name__ == "__main__":
+    graph = BitsetGraph(5)  # 5 nodes (0 to 4)
+    graph.add_edge(0, 1)
+    graph.add_edge(0, 2)
+    graph.add_edge(1, 2)
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 3)
+
+    graph.display()
+    print("Triangles:", graph.triangle_count())                   # Output: 2
+    print("Common neighbors of 0 and 3:", graph.common_neighbors(0, 3))  # Output: 2
+    print("Neighbors of 1:", list(graph.neighbors(1)))           # Output: [0, 2, 3]
+
+    chain = BitsetGraph(4, directed=True)
+    chain.add_edge(0, 1)
+    chain.add_edge(1, 2)
+    chain.add_edge(2, 3)
+    closure = chain.transitive_closure()
+    print("0 reaches 3:", closure.has_edge(0, 3))                # Output: True
+    print("Reachable from 1:", list(closure.neighbors(1)))       # Output: [2, 3]
@@ -0,0 +1,165 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def as_typed_view(buffer, typecode='q'):
+    # Zero-copy memoryview of int64 ('q') or float64 ('d') items over an array, NumPy array,
+    # mmap, shared memory, ...
+    view = memoryview(buffer)
+    if view.format != typecode:
+        view = view.cast('B').cast(typecode)
+    return view
+
+
+def check_node_ids(low, high, n):
+    # Edge endpoints must be nodes 0 .. n-1
+    if low < 0 or high >= n:
+        raise ValueError(f"edge endpoints must lie in 0 .. {n - 1}, found {low if low < 0 else high}")
+
+
+class CSRGraph:
+    # Compressed sparse row graph over integer nodes 0 .. n-1.
+    # The neighbors of u are targets[offsets[u]:offsets[u + 1]]; both buffers are
+    # flat int64 memoryviews, so a neighbor slice is O(1) and never copies.
+    # An undirected edge is stored once in each direction, like adjacency_list_graph.
+    # weights, when given, is a float64 buffer parallel to targets.
+    def __init__(self, offsets, targets, directed=False, weights=None):
+        self.offsets = as_typed_view(offsets)
+        self.targets = as_typed_view(targets)
+        self.weights = None if weights is None else as_typed_view(weights, 'd')
+        self.n = len(self.offsets) - 1
+        self.directed = directed
+
+    @classmethod
+    def from_edges(cls, edges, n=None, directed=False, weights=None):
+        # edges: list of (u, v) pairs (e.g. edge_list_graph.Graph.edges) or an (E, 2) NumPy array;
+        # weights: optional sequence with one weight per edge
+        if np is not None:
+            return cls._from_edges_numpy(edges, n, directed, weights)
+        src = array('q')
+        dst = array('q')
+        wts = array('d')
+        for k, (u, v) in enumerate(edges):
+            src.append(u)
+            dst.append(v)
+            if weights is not None:
+                wts.append(weights[k])
+            if not directed:
+                src.append(v)
+                dst.append(u)
+                if weights is not None:
+                    wts.append(weights[k])
+        top = max(max(src, default=-1), max(dst, default=-1))
+        if n is None:
+            n = top + 1
+        check_node_ids(min(min(src, default=0), min(dst, default=0)), top, n)
+        # Counting sort by source keeps each node's neighbors in insertion order
+        offsets = array('q', [0]) * (n + 1)
+        for u in src:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        fill = offsets[:-1]
+        targets = array('q', [0]) * len(dst)
+        sorted_weights = array('d', [0.0]) * len(wts)
+        for k, u in enumerate(src):
+            targets[fill[u]] = dst[k]
+            if weights is not None:
+                sorted_weights[fill[u]] = wts[k]
+            fill[u] += 1
+        return cls(offsets, targets, directed, sorted_weights if weights is not None else None)
+
+    @classmethod
+    def _from_edges_numpy(cls, edges, n, directed, weights):
+        pairs = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        src, dst = pairs[:, 0], pairs[:, 1]
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            # Interleave (u, v), (v, u) so each node sees neighbors in insertion order
+            src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+            if weights is not None:
+                weights = np.repeat(weights, 2)
+        top = int(max(src.max(initial=-1), dst.max(initial=-1)))
+        if n is None:
+            n = top + 1
+        check_node_ids(int(min(src.min(initial=0), dst.min(initial=0))), top, n)
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        if weights is not None:
+            weights = np.ascontiguousarray(weights[order])
+        return cls(offsets, np.ascontiguousarray(dst[order]), directed, weights)
+
+    @classmethod
+    def from_adjacency_list(cls, adj_list, n=None, directed=False, weights=None):
+        # adj_list: {node: [neighbors]} as in adjacency_list_graph.Graph.adj_list;
+        # weights: optional {node: [weights]} parallel to it
+        low, high = 0, -1
+        for u, neighbors in adj_list.items():
+            low = min(low, u, min(neighbors, default=0))
+            high = max(high, u, max(neighbors, default=-1))
+        if n is None:
+            n = high + 1
+        check_node_ids(low, high, n)
+        offsets = array('q', [0]) * (n + 1)
+        targets = array('q')
+        wts = None if weights is None else array('d')
+        for u in range(n):
+            targets.extend(adj_list.get(u, ()))
+            if weights is not None:
+                wts.extend(weights.get(u, ()))
+            offsets[u + 1] = len(targets)
+        return cls(offsets, targets, directed, wts)
+
+    @classmethod
+    def from_graph(cls, graph, directed=None):
+        # Accepts edge_list_graph.Graph or adjacency_list_graph.Graph, keeping their
+        # direction and, for weighted graphs, their weights
+        if directed is None:
+            directed = getattr(graph, 'directed', False)
+        weights = getattr(graph, 'weights', None) if getattr(graph, 'weighted', False) else None
+        if hasattr(graph, 'adj_list'):
+            # The adjacency list already holds both directions of an undirected edge
+            return cls.from_adjacency_list(graph.adj_list, directed=directed, weights=weights)
+        return cls.from_edges(graph.edges, directed=directed, weights=weights)
+
+    def to_adjacency_list(self):
+        # Back to the {node: [neighbors]} dict used by bfs/dfs and adjacency_list_graph
+        offsets, targets = self.offsets, self.targets
+        return {u: targets[offsets[u]:offsets[u + 1]].tolist() for u in range(self.n)}
+
+    def neighbors(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def neighbor_weights(self, u):
+        # Weights parallel to neighbors(u); requires a weighted graph
+        return self.weights[self.offsets[u]:self.offsets[u + 1]]
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def num_edges(self):
+        # Stored arcs; an undirected edge counts once
+        return len(self.targets) if self.directed else len(self.targets) // 2
+
+    def display(self):
+        for u in range(self.n):
+            print(u, ":", self.neighbors(u).tolist())
+
+
+# Example Usage
+if __name__ == "__main__":
+    edges = [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)]
+    graph = CSRGraph.from_edges(edges)
+    graph.display()
+
+    print("Neighbors of 3:", list(graph.neighbors(3)))  # Output: [1, 2, 4]
+    print("Adjacency list:", graph.to_adjacency_list())
+
+    round_trip = CSRGraph.from_adjacency_list(graph.to_adjacency_list())
+    print("Round trip matches:", round_trip.to_adjacency_list() == graph.to_adjacency_list())
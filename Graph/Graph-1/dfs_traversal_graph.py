@@ -9,13 +9,14 @@ def dfs(graph,node,visited):
             dfs(graph,neighbor,visited)
 
 # Example Graph (Adjacency List)
-graph = {
-    0: [1, 2],
-    1: [0, 3],
-    2: [0, 3],
-    3: [1, 2]
-}
+if __name__ == "__main__":
+    graph = {
+        0: [1, 2],
+        1: [0, 3],
+        2: [0, 3],
+        3: [1, 2]
+    }
 
-# Perform DFS starting from node 0
-visited = set()
-dfs(graph, 0, visited)
\ No newline at end of file
+    # Perform DFS starting from node 0
+    visited = set()
+    dfs(graph, 0, visited)
@@ -0,0 +1,161 @@
+from array import array
+
+from csr_graph import CSRGraph
+from graph_traversal import prepare_graph
+
+
+def topological_sort(graph):
+    # Kahn's algorithm: repeatedly emit a node with no remaining incoming edges.
+    # Accepts a directed adjacency_list_graph.Graph, CSRGraph or {u: [v, ...]} dict.
+    # Raises ValueError if the graph has a cycle (see find_cycle).
+    n, neighbors, labels, _ = prepare_graph(graph)
+    in_degree = array('q', [0]) * n
+    for u in range(n):
+        for v in neighbors(u):
+            in_degree[v] += 1
+    # order doubles as the queue of nodes whose in-degree dropped to 0
+    order = array('q', (u for u in range(n) if in_degree[u] == 0))
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        for v in neighbors(u):
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                order.append(v)
+    if len(order) < n:
+        raise ValueError("graph has a cycle")
+    return order if labels is None else [labels[u] for u in order]
+
+
+def find_cycle(graph):
+    # Iterative DFS; an edge back to a node still on the DFS path closes a cycle.
+    # Returns the cycle as [v0, v1, ..., vk] (with vk -> v0), or None for a DAG.
+    n, neighbors, labels, _ = prepare_graph(graph)
+    # state: 0 = unseen, 1 = on the current path, 2 = finished
+    state = bytearray(n)
+    position = array('q', [0]) * n
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        path = [root]
+        stack = [iter(neighbors(root))]
+        while stack:
+            for v in stack[-1]:
+                if state[v] == 1:
+                    cycle = path[position[v]:]
+                    return cycle if labels is None else [labels[u] for u in cycle]
+                if state[v] == 0:
+                    state[v] = 1
+                    position[v] = len(path)
+                    path.append(v)
+                    stack.append(iter(neighbors(v)))
+                    break
+            else:
+                state[path.pop()] = 2
+                stack.pop()
+    return None
+
+
+def strongly_connected_components(graph):
+    # Tarjan's algorithm with an explicit stack, so depth is limited only by memory.
+    # Returns (count, component): component[u] in 0 .. count-1, numbered in topological
+    # order of the condensation (every edge between components goes to a higher number).
+    # For non-integer labels, component is a {label: number} dict.
+    n, neighbors, labels, _ = prepare_graph(graph)
+    count, component = tarjan(n, neighbors)
+    if labels is None:
+        return count, component
+    return count, {labels[u]: component[u] for u in range(n)}
+
+
+def tarjan(n, neighbors):
+    # Core of strongly_connected_components over the ids 0 .. n-1
+    index = array('q', [-1]) * n
+    low = array('q', [0]) * n
+    on_stack = bytearray(n)
+    stack = array('q')
+    component = array('q', [-1]) * n
+    counter = 0
+    count = 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(neighbors(root)))]
+        while work:
+            u, remaining = work[-1]
+            for v in remaining:
+                if index[v] < 0:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = 1
+                    work.append((v, iter(neighbors(v))))
+                    break
+                if on_stack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[u] < low[parent]:
+                        low[parent] = low[u]
+                if low[u] == index[u]:
+                    # u is the root of a component: everything above it on the stack belongs to it
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = count
+                        if w == u:
+                            break
+                    count += 1
+    # Tarjan finishes components in reverse topological order
+    for u in range(n):
+        component[u] = count - 1 - component[u]
+    return count, component
+
+
+def condensation(graph):
+    # DAG with one node per strongly connected component and one edge per pair of
+    # components joined by at least one edge. Returns (dag as a directed CSRGraph, component).
+    # Node ids of the DAG are already a topological order.
+    n, neighbors, labels, _ = prepare_graph(graph)
+    count, component = tarjan(n, neighbors)
+    edges = set()
+    for u in range(n):
+        cu = component[u]
+        for v in neighbors(u):
+            if component[v] != cu:
+                edges.add((cu, component[v]))
+    dag = CSRGraph.from_edges(sorted(edges), n=count, directed=True)
+    if labels is None:
+        return dag, component
+    return dag, {labels[u]: component[u] for u in range(n)}
+
+
+# Example Usage
+if __name__ == "__main__":
+    from adjacency_list_graph import Graph
+
+    tasks = Graph(directed=True)
+    tasks.add_edge('fetch', 'build')
+    tasks.add_edge('configure', 'build')
+    tasks.add_edge('build', 'test')
+    tasks.add_edge('build', 'package')
+    tasks.add_edge('test', 'deploy')
+    tasks.add_edge('package', 'deploy')
+    print("Order:", topological_sort(tasks))
+    # Output: ['fetch', 'configure', 'build', 'test', 'package', 'deploy']
+
+    graph = {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [5], 5: [3], 6: [5]}
+    print("Cycle:", find_cycle(graph))  # Output: [0, 1, 2]
+    count, component = strongly_connected_components(graph)
+    print("Components:", count, list(component))  # Output: 3 [1, 1, 1, 2, 2, 2, 0]
+    dag, _ = condensation(graph)
+    print("Condensation:", dag.to_adjacency_list())  # Output: {0: [2], 1: [2], 2: []}
+    print("DAG order:", list(topological_sort(dag)))  # Output: [0, 1, 2]
@@ -0,0 +1,149 @@
+import numpy as np
+
+from csr_graph import CSRGraph
+
+
+def csr_arrays(graph):
+    # Zero-copy NumPy views of the CSR buffers
+    return (np.frombuffer(graph.offsets, dtype=np.int64),
+            np.frombuffer(graph.targets, dtype=np.int64))
+
+
+def reverse_csr(offsets, targets):
+    # In-neighbor CSR of a directed graph: arc u -> v is stored as v <- u, sources kept in order
+    n = offsets.size - 1
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    order = np.argsort(targets, kind='stable')
+    reverse_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(targets, minlength=n), out=reverse_offsets[1:])
+    return reverse_offsets, sources[order]
+
+
+def top_down_step(offsets, targets, frontier_nodes, visited):
+    # Expand every frontier node's full neighbor list; returns (new nodes, their parents, edges checked)
+    starts = offsets[frontier_nodes]
+    counts = offsets[frontier_nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, 0
+    # Gather all neighbor slices at once: position k belongs to source repeat(frontier, counts)[k]
+    sources = np.repeat(frontier_nodes, counts)
+    shift = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    neighbors = targets[np.arange(total) + shift]
+    fresh = ~visited[neighbors]
+    neighbors, sources = neighbors[fresh], sources[fresh]
+    # When several frontier nodes reach the same node, the first one in frontier order is its parent
+    nodes, first = np.unique(neighbors, return_index=True)
+    return nodes, sources[first], total
+
+
+def bottom_up_step(offsets, targets, frontier, visited):
+    # Every unvisited node looks for any parent in the frontier and stops at the first hit
+    candidates = np.flatnonzero(~visited)
+    parents = np.full(candidates.size, -1, dtype=np.int64)
+    position = offsets[candidates]
+    end = offsets[candidates + 1]
+    pending = np.arange(candidates.size)
+    checked = 0
+    while pending.size:
+        alive = position[pending] < end[pending]
+        pending = pending[alive]
+        if not pending.size:
+            break
+        neighbor = targets[position[pending]]
+        checked += pending.size
+        hit = frontier[neighbor]
+        parents[pending[hit]] = neighbor[hit]
+        pending = pending[~hit]
+        position[pending] += 1
+    found = parents >= 0
+    return candidates[found], parents[found], checked
+
+
+def direction_optimizing_bfs(graph, start, alpha=14, beta=24):
+    # Level-synchronous BFS (Beamer et al.) over a CSRGraph.
+    # Switches to bottom-up when the frontier's edges exceed the unexplored edges / alpha,
+    # and back to top-down when the frontier shrinks below n / beta.
+    # Returns (parent, distance, edges_checked) as NumPy arrays; like bfs_tree, parent is -1
+    # for the start and unreached nodes, distance is -1 for unreached nodes.
+    # Bottom-up scans a node's in-neighbors: the CSR itself for undirected graphs, a
+    # reverse CSR (built once) for directed ones.
+    offsets, targets = csr_arrays(graph)
+    n = graph.n
+    degrees = np.diff(offsets)
+    if graph.directed:
+        in_offsets, in_targets = reverse_csr(offsets, targets)
+        in_degrees = np.diff(in_offsets)
+    else:
+        in_offsets, in_targets, in_degrees = offsets, targets, degrees
+    parent = np.full(n, -1, dtype=np.int64)
+    distance = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    frontier = np.zeros(n, dtype=bool)
+    distance[start] = 0
+    visited[start] = True
+    frontier[start] = True
+    frontier_nodes = np.array([start], dtype=np.int64)
+    # Edges a bottom-up step would scan: the in-edges of unvisited nodes
+    unexplored_edges = int(in_degrees.sum()) - int(in_degrees[start])
+    edges_checked = 0
+    level = 0
+    bottom_up = False
+    while frontier_nodes.size:
+        frontier_edges = int(degrees[frontier_nodes].sum())
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and frontier_nodes.size < n / beta:
+            bottom_up = False
+        if bottom_up:
+            nodes, parents, checked = bottom_up_step(in_offsets, in_targets, frontier, visited)
+        else:
+            nodes, parents, checked = top_down_step(offsets, targets, frontier_nodes, visited)
+        edges_checked += checked
+        level += 1
+        visited[nodes] = True
+        parent[nodes] = parents
+        distance[nodes] = level
+        frontier[frontier_nodes] = False
+        frontier[nodes] = True
+        frontier_nodes = nodes
+        unexplored_edges -= int(in_degrees[nodes].sum())
+    return parent, distance, edges_checked
+
+
+def top_down_bfs(graph, start):
+    # Same level-synchronous loop, always top-down: the baseline for edge-check counts
+    offsets, targets = csr_arrays(graph)
+    parent = np.full(graph.n, -1, dtype=np.int64)
+    distance = np.full(graph.n, -1, dtype=np.int64)
+    visited = np.zeros(graph.n, dtype=bool)
+    distance[start] = 0
+    visited[start] = True
+    frontier_nodes = np.array([start], dtype=np.int64)
+    edges_checked = 0
+    level = 0
+    while frontier_nodes.size:
+        nodes, parents, checked = top_down_step(offsets, targets, frontier_nodes, visited)
+        edges_checked += checked
+        level += 1
+        visited[nodes] = True
+        parent[nodes] = parents
+        distance[nodes] = level
+        frontier_nodes = nodes
+    return parent, distance, edges_checked
+
+
+# Example Usage
+if __name__ == "__main__":
+    edges = [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (4, 5), (0, 5)]
+    graph = CSRGraph.from_edges(edges)
+    parent, distance, checked = direction_optimizing_bfs(graph, 0)
+    print("Distance:", distance.tolist())  # Output: [0, 1, 1, 2, 2, 1]
+    print("Parent:", parent.tolist())      # Output: [-1, 0, 0, 1, 5, 0]
+    print("Edges checked:", checked)
+
+    # Directed graphs: bottom-up steps follow arcs backwards through a reverse CSR
+    arcs = [(0, v) for v in range(1, 21)] + [(v, 21) for v in range(1, 21)]
+    parent, distance, checked = direction_optimizing_bfs(CSRGraph.from_edges(arcs, directed=True), 0)
+    print("Directed distance:", distance.tolist()[:3], distance[21])  # Output: [0, 1, 1] 2
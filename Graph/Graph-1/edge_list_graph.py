@@ -1,19 +1,29 @@
 class Graph:
-    def __init__(self):
+    def __init__(self, directed=False):
         self.edges = []
+        self.weights = [] #weights[i] is the weight of edges[i]
+        self.directed = directed
+        self.weighted = False
     
-    def add_edge(self,u,v):
+    def add_edge(self,u,v,weight=1):
         self.edges.append((u,v))
+        self.weights.append(weight)
+        if weight != 1:
+            self.weighted = True
     
     def display(self):
-        for edge in self.edges:
-            print(edge)
+        for edge, weight in zip(self.edges, self.weights):
+            if self.weighted:
+                print(edge, weight)
+            else:
+                print(edge)
 
 # Example Usage
-graph = Graph()
-graph.add_edge(1, 2)
-graph.add_edge(1, 3)
-graph.add_edge(2, 4)
-graph.add_edge(3, 4)
+if __name__ == "__main__":
+    graph = Graph()
+    graph.add_edge(1, 2)
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 4)
+    graph.add_edge(3, 4)
 
-graph.display()
\ No newline at end of file
+    graph.display()
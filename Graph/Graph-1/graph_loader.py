@@ -0,0 +1,188 @@
+import io
+import mmap
+import os
+import struct
+from array import array
+
+from csr_graph import CSRGraph, np
+
+# Cache layout: header, then offsets (n + 1 int64), targets (arcs int64) and, for weighted
+# graphs, weights (arcs float64), all little-endian and 8-byte aligned so they can be mapped
+# straight into CSRGraph. The source file's size and mtime are stored to detect stale caches.
+MAGIC = b'CSRGRPH1'
+HEADER = struct.Struct('<8sqqqqqq')  # magic, source size, source mtime_ns, directed, weighted, n, arcs
+COMMENT_PREFIXES = (b'#', b'%')
+CHUNK_SIZE = 1 << 24
+EDGE_DTYPE = None if np is None else np.dtype([('u', '<i8'), ('v', '<i8'), ('w', '<f8')])
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    # Yield the file in blocks of whole lines, without the comment lines (# or %)
+    with open(path, 'rb') as f:
+        rest = b''
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            block = rest + block
+            cut = block.rfind(b'\n') + 1
+            if cut == 0:
+                rest = block
+                continue
+            rest = block[cut:]
+            yield strip_comments(block[:cut])
+        if rest:
+            yield strip_comments(rest)
+
+
+def strip_comments(chunk):
+    if b'#' not in chunk and b'%' not in chunk:
+        return chunk
+    return b'\n'.join(line for line in chunk.split(b'\n') if not line.lstrip().startswith(COMMENT_PREFIXES))
+
+
+def count_columns(path):
+    # 2 columns: "u v" per line; 3 columns: "u v weight"
+    for chunk in read_chunks(path, 1 << 16):
+        for line in chunk.split(b'\n'):
+            fields = line.split()
+            if fields:
+                if len(fields) not in (2, 3):
+                    raise ValueError("expected 'u v' or 'u v weight' lines, got {!r}".format(line))
+                return len(fields)
+    return 2
+
+
+def parse_chunk(chunk, columns):
+    # Returns (sources, targets, weights or None) for one block of lines. Every line must
+    # have the same number of fields; ids are parsed as int64, weights as float64.
+    if not chunk.strip():
+        empty = array('q')
+        return empty, empty, None if columns == 2 else array('d')
+    if np is not None:
+        dtype = np.int64 if columns == 2 else EDGE_DTYPE
+        try:
+            values = np.loadtxt(io.BytesIO(chunk), dtype=dtype, comments=None, ndmin=1 if columns == 3 else 2)
+        except ValueError as error:
+            raise ValueError("malformed edge list: {}".format(error)) from error
+        if columns == 2:
+            return np.ascontiguousarray(values[:, 0]), np.ascontiguousarray(values[:, 1]), None
+        return (np.ascontiguousarray(values['u']), np.ascontiguousarray(values['v']),
+                np.ascontiguousarray(values['w']))
+    sources, targets = array('q'), array('q')
+    weights = None if columns == 2 else array('d')
+    for line in chunk.split(b'\n'):
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) != columns:
+            raise ValueError("malformed edge list: expected {} fields, got {!r}".format(columns, line))
+        try:
+            sources.append(int(fields[0]))
+            targets.append(int(fields[1]))
+            if weights is not None:
+                weights.append(float(fields[2]))
+        except (ValueError, OverflowError) as error:
+            raise ValueError("malformed edge list: {}".format(error)) from error
+    return sources, targets, weights
+
+
+def parse_edge_list(path, chunk_size=CHUNK_SIZE):
+    # Parse a whitespace-separated text edge list chunk by chunk into flat arrays.
+    # Returns (sources, targets, weights or None) as int64 / float64 buffers.
+    columns = count_columns(path)
+    sources, targets = array('q'), array('q')
+    weights = array('d') if columns == 3 else None
+    for chunk in read_chunks(path, chunk_size):
+        src, dst, wts = parse_chunk(chunk, columns)
+        sources.frombytes(memoryview(src).cast('B'))
+        targets.frombytes(memoryview(dst).cast('B'))
+        if weights is not None:
+            weights.frombytes(memoryview(wts).cast('B'))
+    return sources, targets, weights
+
+
+def source_stamp(path):
+    info = os.stat(path)
+    return info.st_size, info.st_mtime_ns
+
+
+def write_csr_cache(graph, cache_path, stamp=(0, 0)):
+    # Write the CSR buffers behind a header; the file is swapped in atomically
+    weighted = graph.weights is not None
+    header = HEADER.pack(MAGIC, stamp[0], stamp[1], int(graph.directed), int(weighted),
+                         graph.n, len(graph.targets))
+    temp_path = cache_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(graph.offsets.cast('B'))
+        f.write(graph.targets.cast('B'))
+        if weighted:
+            f.write(graph.weights.cast('B'))
+    os.replace(temp_path, cache_path)
+
+
+def read_header(cache_path):
+    with open(cache_path, 'rb') as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        return None
+    header = HEADER.unpack(data)
+    return header if header[0] == MAGIC else None
+
+
+def load_csr_cache(cache_path):
+    # Map the cache file read-only and hand CSRGraph memoryviews over the mapping:
+    # nothing is parsed or copied, pages are read by the OS on first touch
+    with open(cache_path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, _, _, directed, weighted, n, arcs = HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        mapping.close()
+        raise ValueError("{} is not a CSR cache file".format(cache_path))
+    view = memoryview(mapping)
+    start = HEADER.size
+    offsets = view[start:start + 8 * (n + 1)]
+    start += 8 * (n + 1)
+    targets = view[start:start + 8 * arcs]
+    start += 8 * arcs
+    weights = view[start:start + 8 * arcs] if weighted else None
+    graph = CSRGraph(offsets, targets, bool(directed), weights)
+    graph.mapping = mapping  # keeps the mapping alive as long as the graph
+    return graph
+
+
+def load_edge_list(path, directed=False, cache_path=None, rebuild=False, chunk_size=CHUNK_SIZE):
+    # Load a text edge list ("u v" or "u v weight" per line, # / % comments) as a CSRGraph.
+    # The first run parses the file and writes <path>.csr next to it; later runs map that
+    # cache directly as long as the source file is unchanged.
+    if cache_path is None:
+        cache_path = path + '.csr'
+    stamp = source_stamp(path)
+    if not rebuild and os.path.exists(cache_path):
+        header = read_header(cache_path)
+        if header is not None and header[1:4] == (stamp[0], stamp[1], int(directed)):
+            return load_csr_cache(cache_path)
+    sources, targets, weights = parse_edge_list(path, chunk_size)
+    if np is not None:
+        edges = np.column_stack((np.frombuffer(sources, dtype=np.int64), np.frombuffer(targets, dtype=np.int64)))
+    else:
+        edges = zip(sources, targets)
+    del sources, targets
+    write_csr_cache(CSRGraph.from_edges(edges, directed=directed, weights=weights), cache_path, stamp)
+    return load_csr_cache(cache_path)
+
+
+# Example Usage
+if __name__ == "__main__":
+    import tempfile
+
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, 'edges.txt')
+    with open(path, 'w') as f:
+        f.write("# u v\n0 1\n0 2\n1 3\n2 3\n3 4\n")
+
+    graph = load_edge_list(path)            # parses and writes edges.txt.csr
+    print("Neighbors of 3:", list(graph.neighbors(3)))  # Output: [1, 2, 4]
+    graph = load_edge_list(path)            # maps edges.txt.csr, no parsing
+    print("Adjacency list:", graph.to_adjacency_list())
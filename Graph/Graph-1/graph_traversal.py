@@ -0,0 +1,179 @@
+from array import array
+from collections import namedtuple
+from operator import index as as_int
+
+from csr_graph import CSRGraph
+
+# order: nodes in visit order
+# parent: parent[v] in the search tree (-1 / None for the start and unreached nodes)
+# distance: BFS hop count or DFS tree depth (-1 / missing for unreached nodes)
+TraversalResult = namedtuple('TraversalResult', ['order', 'parent', 'distance'])
+
+
+def prepare_graph(graph):
+    # Returns (n, neighbors, labels, index). Nodes are the ints 0 .. n-1; labels and index
+    # are None when the graph already uses those ids, otherwise labels[i] is the original
+    # node of id i and index maps it back to i.
+    if isinstance(graph, CSRGraph):
+        return graph.n, graph.neighbors, None, None
+    adj = getattr(graph, 'adj_list', graph)
+    n = entries = 0
+    for u, neighbors in adj.items():
+        entries += 1 + len(neighbors)
+        for v in (u, *neighbors):
+            if type(v) is not int or v < 0:
+                return relabel(adj)
+            if v >= n:
+                n = v + 1
+    if n > 2 * entries:
+        # Sparse ids like {5_000_000_000: [1]}: per-id arrays would dwarf the graph
+        return relabel(adj)
+    empty = ()
+    return n, lambda u: adj.get(u, empty), None, None
+
+
+def relabel(adj, weighted=False):
+    # Number the nodes of a dict graph 0 .. n-1 in first-seen order; returns
+    # (n, neighbors, labels, index) like prepare_graph. With weighted=True the
+    # adjacency items are (v, weight) pairs, as in shortest_paths.
+    labels = list(adj)
+    index = {label: i for i, label in enumerate(labels)}
+    for items in adj.values():
+        for item in items:
+            v = item[0] if weighted else item
+            if v not in index:
+                index[v] = len(labels)
+                labels.append(v)
+    if weighted:
+        ids = [[(index[v], w) for v, w in adj.get(label, ())] for label in labels]
+    else:
+        ids = [[index[v] for v in adj.get(label, ())] for label in labels]
+    return len(labels), ids.__getitem__, labels, index
+
+
+def node_id(start, n, index):
+    # Id of a start node; KeyError if the graph has no such node
+    if index is not None:
+        if start not in index:
+            raise KeyError(start)
+        return index[start]
+    try:
+        u = as_int(start)
+    except TypeError:
+        raise KeyError(start) from None
+    if not 0 <= u < n:
+        raise KeyError(start)
+    return u
+
+
+def traversal_result(order, parent, distance, labels):
+    if labels is None:
+        return TraversalResult(order, parent, distance)
+    return TraversalResult(
+        [labels[u] for u in order],
+        {labels[u]: (labels[parent[u]] if parent[u] >= 0 else None) for u in order},
+        {labels[u]: distance[u] for u in order},
+    )
+
+
+def bfs_tree(graph, start):
+    # Iterative BFS. Accepts an adjacency-list dict, adjacency_list_graph.Graph or CSRGraph.
+    # Nodes are marked when enqueued, so each enters the queue once, and the order
+    # array doubles as the queue.
+    n, neighbors, labels, index = prepare_graph(graph)
+    src = node_id(start, n, index)
+    visited = bytearray(n)
+    parent = array('q', [-1]) * n
+    distance = array('q', [-1]) * n
+    order = array('q', [src])
+    visited[src] = 1
+    distance[src] = 0
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        next_distance = distance[u] + 1
+        for v in neighbors(u):
+            if not visited[v]:
+                visited[v] = 1
+                parent[v] = u
+                distance[v] = next_distance
+                order.append(v)
+    return traversal_result(order, parent, distance, labels)
+
+
+def dfs_tree(graph, start):
+    # Iterative DFS visiting nodes in the same order as the recursive dfs, without
+    # touching the recursion limit. distance holds the depth in the DFS tree.
+    n, neighbors, labels, index = prepare_graph(graph)
+    src = node_id(start, n, index)
+    visited = bytearray(n)
+    parent = array('q', [-1]) * n
+    distance = array('q', [-1]) * n
+    order = array('q', [src])
+    visited[src] = 1
+    distance[src] = 0
+    stack = [(src, iter(neighbors(src)))]
+    while stack:
+        u, remaining = stack[-1]
+        for v in remaining:
+            if not visited[v]:
+                visited[v] = 1
+                parent[v] = u
+                distance[v] = distance[u] + 1
+                order.append(v)
+                stack.append((v, iter(neighbors(v))))
+                break
+        else:
+            stack.pop()
+    return traversal_result(order, parent, distance, labels)
+
+
+def connected_components(graph):
+    # Component label of every node of an undirected graph: the smallest node id in
+    # its component (the first label in dict order for non-integer labels).
+    n, neighbors, labels, _ = prepare_graph(graph)
+    component = array('q', [-1]) * n
+    for root in range(n):
+        if component[root] >= 0:
+            continue
+        component[root] = root
+        queue = array('q', [root])
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for v in neighbors(u):
+                if component[v] < 0:
+                    component[v] = root
+                    queue.append(v)
+    if labels is None:
+        return component
+    return {labels[u]: labels[component[u]] for u in range(n)}
+
+
+# Example Graph
+if __name__ == "__main__":
+    graph = {
+        0: [1, 2],
+        1: [0, 3],
+        2: [0, 3],
+        3: [1, 2]
+    }
+
+    result = bfs_tree(graph, 0)
+    print("BFS order:", list(result.order))        # Output: [0, 1, 2, 3]
+    print("BFS distance:", list(result.distance))  # Output: [0, 1, 1, 2]
+
+    result = dfs_tree(CSRGraph.from_adjacency_list(graph), 0)
+    print("DFS order:", list(result.order))        # Output: [0, 1, 3, 2]
+    print("DFS parent:", list(result.parent))      # Output: [-1, 0, 3, 1]
+
+    # A path of 100,000 nodes would overflow the recursive dfs
+    path = CSRGraph.from_edges([(i, i + 1) for i in range(100_000)])
+    print("Deepest node:", dfs_tree(path, 0).order[-1])  # Output: 100000
+
+    print("Components:", list(connected_components({0: [1], 1: [0], 2: [3], 3: [2], 4: []})))  # Output: [0, 0, 2, 2, 4]
+
+    # Non-integer labels come back as dicts
+    print(bfs_tree({'A': ['B', 'C'], 'B': ['D'], 'C': ['D']}, 'A'))
@@ -0,0 +1,159 @@
+class MutableGraph:
+    # Adjacency-list graph for incremental updates: no duplicate edges, edge removal,
+    # vertex insertion/removal and degrees kept up to date on every change.
+    # adj_list / weights have the same layout as adjacency_list_graph.Graph, so the traversal
+    # and shortest-path modules accept a MutableGraph unchanged.
+    # A vertex whose degree passes index_threshold also gets index[u] = {v: position in adj_list[u]},
+    # which makes has_edge / remove_edge O(1) there; below the threshold a short list scan is cheaper
+    # than a dict per vertex. The index is dropped again once the degree falls to a quarter of it.
+    def __init__(self, directed=False, index_threshold=32):
+        self.adj_list = {}
+        self.weights = {} #weights[u][i] is the weight of the edge to adj_list[u][i]
+        self.index = {}
+        self.in_degrees = {} #only for directed graphs; out-degree is len(adj_list[u])
+        self.directed = directed
+        self.weighted = False
+        self.index_threshold = index_threshold
+        self.edge_count = 0
+
+    def add_vertex(self, u):
+        if u not in self.adj_list:
+            self.adj_list[u] = []
+            self.weights[u] = []
+            if self.directed:
+                self.in_degrees[u] = 0
+
+    def _position(self, u, v):
+        positions = self.index.get(u)
+        if positions is not None:
+            return positions.get(v, -1)
+        neighbors = self.adj_list[u]
+        for i in range(len(neighbors)):
+            if neighbors[i] == v:
+                return i
+        return -1
+
+    def _append(self, u, v, weight):
+        neighbors = self.adj_list[u]
+        neighbors.append(v)
+        self.weights[u].append(weight)
+        positions = self.index.get(u)
+        if positions is not None:
+            positions[v] = len(neighbors) - 1
+        elif len(neighbors) > self.index_threshold:
+            self.index[u] = {w: i for i, w in enumerate(neighbors)}
+
+    def _delete(self, u, i):
+        # Swap with the last slot and pop, so removal never shifts the list
+        neighbors, weights = self.adj_list[u], self.weights[u]
+        removed = neighbors[i]
+        last = len(neighbors) - 1
+        neighbors[i], weights[i] = neighbors[last], weights[last]
+        neighbors.pop()
+        weights.pop()
+        positions = self.index.get(u)
+        if positions is not None:
+            del positions[removed]
+            if i != last:
+                positions[neighbors[i]] = i
+            if len(neighbors) <= self.index_threshold // 4:
+                del self.index[u]
+
+    def add_edge(self, u, v, weight=1):
+        # Returns True if the edge is new; an existing edge just takes the new weight
+        self.add_vertex(u)
+        self.add_vertex(v)
+        if weight != 1:
+            self.weighted = True
+        i = self._position(u, v)
+        if i >= 0:
+            self.weights[u][i] = weight
+            if not self.directed and u != v:
+                self.weights[v][self._position(v, u)] = weight
+            return False
+        self._append(u, v, weight)
+        if self.directed:
+            self.in_degrees[v] += 1
+        elif u != v:
+            self._append(v, u, weight)
+        self.edge_count += 1
+        return True
+
+    def has_edge(self, u, v):
+        return u in self.adj_list and self._position(u, v) >= 0
+
+    def edge_weight(self, u, v):
+        i = self._position(u, v) if u in self.adj_list else -1
+        if i < 0:
+            raise KeyError((u, v))
+        return self.weights[u][i]
+
+    def remove_edge(self, u, v):
+        i = self._position(u, v) if u in self.adj_list else -1
+        if i < 0:
+            raise KeyError((u, v))
+        self._delete(u, i)
+        if self.directed:
+            self.in_degrees[v] -= 1
+        elif u != v:
+            self._delete(v, self._position(v, u))
+        self.edge_count -= 1
+
+    def remove_vertex(self, u):
+        # O(degree) for undirected graphs. A directed graph keeps no reverse lists,
+        # so incoming edges are found by checking every vertex (skipped when in-degree is 0).
+        if u not in self.adj_list:
+            raise KeyError(u)
+        if self.directed and self.in_degrees[u]:
+            for w in self.adj_list:
+                if w != u and self._position(w, u) >= 0:
+                    self.remove_edge(w, u)
+        while self.adj_list[u]:
+            self.remove_edge(u, self.adj_list[u][-1])
+        del self.adj_list[u]
+        del self.weights[u]
+        self.index.pop(u, None)
+        if self.directed:
+            del self.in_degrees[u]
+
+    def degree(self, u):
+        return len(self.adj_list[u])
+
+    def in_degree(self, u):
+        return self.in_degrees[u] if self.directed else len(self.adj_list[u])
+
+    def neighbors(self, u):
+        return self.adj_list[u]
+
+    def __contains__(self, u):
+        return u in self.adj_list
+
+    def __len__(self):
+        return len(self.adj_list)
+
+    def display(self):
+        for node in self.adj_list:
+            if self.weighted:
+                print(node, ":", list(zip(self.adj_list[node], self.weights[node])))
+            else:
+                print(node, ":", self.adj_list[node])
+
+
+# Example Usage
+if __name__ == "__main__":
+    graph = MutableGraph()
+    graph.add_edge(1, 2)
+    graph.add_edge(1, 3)
+    graph.add_edge(2, 4)
+    graph.add_edge(3, 4)
+    graph.add_edge(2, 1)              # duplicate, ignored
+    graph.add_vertex(5)
+
+    print("Edges:", graph.edge_count)          # Output: 4
+    print("1 - 2:", graph.has_edge(1, 2))      # Output: True
+    graph.remove_edge(1, 2)
+    print("1 - 2:", graph.has_edge(1, 2))      # Output: False
+    graph.remove_vertex(4)
+    print("Degree of 3:", graph.degree(3))     # Output: 1
+
+    graph.display()
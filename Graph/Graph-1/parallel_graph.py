@@ -0,0 +1,214 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+# Buffers attached in each worker process: name -> (SharedMemory, NumPy view)
+_WORKER_BUFFERS = {}
+
+
+def _attach(specs):
+    # Pool initializer: map every shared block into this worker without copying
+    for key, name, dtype, length in specs:
+        block = shared_memory.SharedMemory(name=name)
+        _WORKER_BUFFERS[key] = (block, np.ndarray((length,), dtype=dtype, buffer=block.buf))
+
+
+def _view(key):
+    return _WORKER_BUFFERS[key][1]
+
+
+def expand_frontier(offsets, targets, visited, frontier_nodes):
+    # One top-down BFS step over part of a frontier, preserving sequential order:
+    # returns (new nodes in discovery order, parent of each)
+    starts = offsets[frontier_nodes]
+    counts = offsets[frontier_nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    sources = np.repeat(frontier_nodes, counts)
+    neighbors = targets[np.arange(total) + np.repeat(starts - np.cumsum(counts) + counts, counts)]
+    fresh = ~visited[neighbors]
+    return first_occurrences(neighbors[fresh], sources[fresh])
+
+
+def first_occurrences(nodes, parents):
+    # Keep the first (node, parent) pair for every node, in their original order
+    _, first = np.unique(nodes, return_index=True)
+    first.sort()
+    return nodes[first], parents[first]
+
+
+def _expand_task(lo, hi):
+    return expand_frontier(_view('offsets'), _view('targets'), _view('visited'), _view('frontier')[lo:hi])
+
+
+def min_label_components(n, sources, dests):
+    # Vectorized FastSV (hooking + shortcutting): label[u] converges to the smallest node id
+    # reachable from u through the given edges, in O(log n) array passes.
+    parent = np.arange(n, dtype=np.int64)
+    if not sources.size:
+        return parent
+    grandparent = parent
+    while True:
+        hooked = parent.copy()
+        np.minimum.at(hooked, grandparent[sources], grandparent[dests])
+        np.minimum.at(hooked, grandparent[dests], grandparent[sources])
+        np.minimum.at(hooked, sources, grandparent[dests])
+        np.minimum.at(hooked, dests, grandparent[sources])
+        np.minimum(hooked, grandparent, out=hooked)
+        parent = hooked
+        jumped = parent[parent]
+        if (jumped == grandparent).all():
+            break
+        grandparent = jumped
+    while True:
+        jumped = parent[parent]
+        if (jumped == parent).all():
+            return parent
+        parent = jumped
+
+
+def partial_components(offsets, targets, lo, hi):
+    # Components using only the edges of nodes lo .. hi-1, reduced to the (node, label)
+    # pairs with node != label: at most one pair per node, whatever the edge count
+    counts = np.diff(offsets[lo:hi + 1])
+    sources = np.repeat(np.arange(lo, hi, dtype=np.int64), counts)
+    dests = targets[offsets[lo]:offsets[hi]]
+    labels = min_label_components(len(offsets) - 1, sources, dests)
+    moved = np.flatnonzero(labels != np.arange(labels.size))
+    return moved, labels[moved]
+
+
+def _components_task(lo, hi):
+    return partial_components(_view('offsets'), _view('targets'), lo, hi)
+
+
+class ParallelGraph:
+    # Process pool over a CSRGraph whose buffers live in multiprocessing.shared_memory,
+    # so each worker maps the adjacency data instead of receiving a copy.
+    # Use as a context manager; the pool and the shared blocks are released on exit.
+    def __init__(self, graph, workers=None, min_parallel_frontier=4096):
+        self.graph = graph
+        self.n = graph.n
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_frontier = min_parallel_frontier
+        self.blocks = []
+        specs = []
+        arrays = {}
+        sources = {
+            'offsets': np.frombuffer(graph.offsets, dtype=np.int64),
+            'targets': np.frombuffer(graph.targets, dtype=np.int64),
+            'visited': np.zeros(self.n, dtype=bool),
+            'frontier': np.zeros(self.n, dtype=np.int64),
+        }
+        try:
+            for key, source in sources.items():
+                block = shared_memory.SharedMemory(create=True, size=max(1, source.nbytes))
+                self.blocks.append(block)
+                view = np.ndarray(source.shape, dtype=source.dtype, buffer=block.buf)
+                view[:] = source
+                arrays[key] = view
+                specs.append((key, block.name, source.dtype.str, source.size))
+            self.offsets, self.targets = arrays['offsets'], arrays['targets']
+            self.visited, self.frontier = arrays['visited'], arrays['frontier']
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_attach, initargs=(specs,))
+        except BaseException:
+            self._release()
+            raise
+
+    def _release(self):
+        self.offsets = self.targets = self.visited = self.frontier = None
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def close(self):
+        if self.blocks:
+            self.pool.shutdown()
+            self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _chunks(self, size):
+        step = -(-size // self.workers)
+        return [(lo, min(lo + step, size)) for lo in range(0, size, step)]
+
+    def bfs(self, start):
+        # Level-synchronous BFS; each large frontier is split into contiguous chunks, one per
+        # worker. Chunk results are merged in order, so order, parent and distance match
+        # graph_traversal.bfs_tree exactly. Returns (order, parent, distance) NumPy arrays.
+        n = self.n
+        visited, frontier = self.visited, self.frontier
+        visited[:] = False
+        parent = np.full(n, -1, dtype=np.int64)
+        distance = np.full(n, -1, dtype=np.int64)
+        visited[start] = True
+        distance[start] = 0
+        levels = [np.array([start], dtype=np.int64)]
+        current = levels[0]
+        level = 0
+        while current.size:
+            if current.size < self.min_parallel_frontier:
+                nodes, parents = expand_frontier(self.offsets, self.targets, visited, current)
+            else:
+                frontier[:current.size] = current
+                futures = [self.pool.submit(_expand_task, lo, hi) for lo, hi in self._chunks(current.size)]
+                parts = [future.result() for future in futures]
+                nodes, parents = first_occurrences(np.concatenate([p[0] for p in parts]),
+                                                   np.concatenate([p[1] for p in parts]))
+            level += 1
+            visited[nodes] = True
+            parent[nodes] = parents
+            distance[nodes] = level
+            levels.append(nodes)
+            current = nodes
+        return np.concatenate(levels), parent, distance
+
+    def connected_components(self):
+        # Every worker labels the components formed by its slice of the edges; the master
+        # merges the (node, label) pairs with one more pass. Labels are the smallest node id
+        # in each component, exactly as in graph_traversal.connected_components.
+        # Edge direction is ignored (weakly connected components for directed graphs).
+        n = self.n
+        # Split by edge count rather than node count so the workers get similar work
+        bounds = np.searchsorted(self.offsets, np.linspace(0, self.offsets[-1], self.workers + 1))
+        bounds[0], bounds[-1] = 0, n
+        tasks = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if lo < hi]
+        futures = [self.pool.submit(_components_task, lo, hi) for lo, hi in tasks]
+        parts = [future.result() for future in futures]
+        if not parts:
+            return np.arange(n, dtype=np.int64)
+        return min_label_components(n, np.concatenate([p[0] for p in parts]),
+                                    np.concatenate([p[1] for p in parts]))
+
+
+def parallel_bfs(graph, start, workers=None):
+    with ParallelGraph(graph, workers) as shared:
+        return shared.bfs(start)
+
+
+def parallel_connected_components(graph, workers=None):
+    with ParallelGraph(graph, workers) as shared:
+        return shared.connected_components()
+
+
+# Example Usage
+if __name__ == "__main__":
+    edges = [(0, 1), (0, 2), (1, 3), (2, 3), (4, 5), (6, 6)]
+    graph = CSRGraph.from_edges(edges)
+
+    with ParallelGraph(graph, workers=2, min_parallel_frontier=1) as shared:
+        order, parent, distance = shared.bfs(0)
+        print("BFS order:", order.tolist())          # Output: [0, 1, 2, 3]
+        print("Distance:", distance.tolist())        # Output: [0, 1, 1, 2, -1, -1, -1]
+        print("Components:", shared.connected_components().tolist())  # Output: [0, 0, 0, 0, 4, 4, 6]
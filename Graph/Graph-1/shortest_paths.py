@@ -0,0 +1,124 @@
+from array import array
+from heapq import heappop, heappush
+
+from csr_graph import CSRGraph
+from graph_traversal import node_id, relabel
+
+INF = float('inf')
+
+
+def prepare_weighted_graph(graph):
+    # Returns (n, edges, labels, index): edges(u) yields (v, weight) pairs over ids 0 .. n-1;
+    # labels and index are None when the graph already uses those ids (see
+    # graph_traversal.prepare_graph).
+    # Accepts CSRGraph (weighted or not), adjacency_list_graph.Graph, adjacency_matrix_graph.Graph
+    # or a dict {u: [(v, weight), ...]}.
+    if isinstance(graph, CSRGraph):
+        if graph.weights is None:
+            return graph.n, lambda u: ((v, 1) for v in graph.neighbors(u)), None, None
+        return graph.n, lambda u: zip(graph.neighbors(u), graph.neighbor_weights(u)), None, None
+    if hasattr(graph, 'matrix'):
+        # A 0 cell is "no edge"; add_edge refuses to store a weight of 0
+        rows = graph.matrix
+        return graph.size, lambda u: ((v, w) for v, w in enumerate(rows[u]) if w), None, None
+    if hasattr(graph, 'adj_list'):
+        adj = {u: list(zip(graph.adj_list[u], graph.weights[u])) for u in graph.adj_list}
+    else:
+        adj = graph
+    n = entries = 0
+    for u, edges in adj.items():
+        entries += 1 + len(edges)
+        for v in (u, *(v for v, _ in edges)):
+            if type(v) is not int or v < 0:
+                return relabel(adj, weighted=True)
+            if v >= n:
+                n = v + 1
+    if n > 2 * entries:
+        return relabel(adj, weighted=True)
+    empty = ()
+    return n, lambda u: adj.get(u, empty), None, None
+
+
+def _search(graph, source, target, heuristic):
+    n, edges, labels, index = prepare_weighted_graph(graph)
+    src = node_id(source, n, index)
+    goal = -1 if target is None else node_id(target, n, index)
+    dist = array('d', [INF]) * n
+    pred = array('q', [-1]) * n
+    done = bytearray(n)
+    dist[src] = 0.0
+    estimate = (lambda u: 0) if heuristic is None else (
+        heuristic if labels is None else (lambda u: heuristic(labels[u])))
+    heap = [(estimate(src), src)]
+    while heap:
+        _, u = heappop(heap)
+        # Lazy deletion: skip heap entries left behind by a later improvement
+        if done[u]:
+            continue
+        done[u] = 1
+        if u == goal:
+            break
+        base = dist[u]
+        for v, weight in edges(u):
+            if weight < 0:
+                raise ValueError("negative edge weight")
+            candidate = base + weight
+            if candidate < dist[v]:
+                dist[v] = candidate
+                pred[v] = u
+                heappush(heap, (candidate + estimate(v), v))
+    if labels is None:
+        return dist, pred
+    return ({labels[u]: dist[u] for u in range(n) if dist[u] < INF},
+            {labels[u]: labels[pred[u]] for u in range(n) if pred[u] >= 0})
+
+
+def dijkstra(graph, source, target=None):
+    # Single-source shortest paths with a binary heap and lazy deletion.
+    # Stops as soon as target is settled. Returns (dist, pred): array('d') / array('q')
+    # indexed by node (inf / -1 when unreached), or dicts for non-integer labels.
+    return _search(graph, source, target, None)
+
+
+def a_star(graph, source, target, heuristic):
+    # Dijkstra ordered by dist + heuristic(node). The heuristic must never overestimate
+    # the remaining distance (and should be consistent) for the path to be shortest.
+    return _search(graph, source, target, heuristic)
+
+
+def reconstruct_path(pred, source, target):
+    # Walk the predecessor array (or dict) back from target; [] if target is unreachable
+    path = [target]
+    while path[-1] != source:
+        step = pred.get(path[-1], -1) if isinstance(pred, dict) else pred[path[-1]]
+        if step is None or step == -1:
+            return []
+        path.append(step)
+    path.reverse()
+    return path
+
+
+# Example Usage
+if __name__ == "__main__":
+    from adjacency_list_graph import Graph
+
+    roads = Graph(directed=True)
+    roads.add_edge(0, 1, 7)
+    roads.add_edge(0, 2, 2)
+    roads.add_edge(2, 1, 3)
+    roads.add_edge(1, 3, 1)
+    roads.add_edge(2, 3, 8)
+
+    dist, pred = dijkstra(roads, 0)
+    print("Distances:", list(dist))                       # Output: [0.0, 5.0, 2.0, 6.0]
+    print("Path 0 -> 3:", reconstruct_path(pred, 0, 3))  # Output: [0, 2, 1, 3]
+
+    # A* on a 4-connected grid with the Manhattan distance as heuristic
+    grid = {}
+    for x in range(5):
+        for y in range(5):
+            grid[(x, y)] = [((x + dx, y + dy), 1) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                            if 0 <= x + dx < 5 and 0 <= y + dy < 5]
+    goal = (4, 4)
+    dist, pred = a_star(grid, (0, 0), goal, lambda p: abs(p[0] - goal[0]) + abs(p[1] - goal[1]))
+    print("Grid distance:", dist[goal])  # Output: 8.0
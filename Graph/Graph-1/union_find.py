@@ -0,0 +1,129 @@
+from array import array
+from operator import index as as_int
+
+from edge_list_graph import Graph
+
+
+class DisjointSetUnion:
+    # Array-backed union-find over the ints 0 .. n-1 with path halving and union by size.
+    # parent[x] == x marks a root; size[root] is the number of nodes in its set.
+    # add() grows the universe when a stream brings in node ids past n.
+    def __init__(self, n=0):
+        self.parent = array('q', range(n))
+        self.size = array('q', [1]) * n
+        self.components = n
+
+    def add(self, x):
+        # Make sure 0 .. x all exist (each new id starts as its own set)
+        x = as_int(x)
+        if x < 0:
+            raise ValueError("node ids must be non-negative, got {}".format(x))
+        grow = x + 1 - len(self.parent)
+        if grow > 0:
+            self.parent.extend(range(len(self.parent), x + 1))
+            self.size.extend(array('q', [1]) * grow)
+            self.components += grow
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            # Path halving: point x at its grandparent while walking up
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        # Merge the sets of a and b; returns False if they were already connected
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self.components -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x):
+        return self.size[self.find(x)]
+
+    def __len__(self):
+        return len(self.parent)
+
+
+class StreamingConnectivityGraph(Graph):
+    # edge_list_graph.Graph whose add_edge also feeds a DisjointSetUnion, so
+    # "are u and v connected?" costs near O(1) per edge instead of a fresh DFS.
+    # Nodes can be any hashable labels: index maps each one to a dense DSU id in
+    # first-seen order. Edge direction is ignored for connectivity.
+    def __init__(self, directed=False):
+        super().__init__(directed)
+        self.dsu = DisjointSetUnion()
+        self.index = {}
+
+    def node_id(self, label):
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.index)
+            self.dsu.add(i)
+        return i
+
+    def add_edge(self, u, v, weight=1):
+        # The DSU goes first, so a label that cannot be hashed leaves the edge list untouched
+        self.dsu.union(self.node_id(u), self.node_id(v))
+        super().add_edge(u, v, weight)
+
+    def connected(self, u, v):
+        if u not in self.index or v not in self.index:
+            return u == v
+        return self.dsu.connected(self.index[u], self.index[v])
+
+    def component_count(self):
+        return self.dsu.components
+
+
+def kruskal_mst(graph, n=None):
+    # Minimum spanning forest of an edge_list_graph.Graph: sort the edges by weight once,
+    # then keep every edge that joins two different components.
+    # Returns (total weight, [(u, v, weight), ...]).
+    if n is None:
+        n = 1 + max((max(u, v) for u, v in graph.edges), default=-1)
+    dsu = DisjointSetUnion(n)
+    weights = graph.weights
+    order = sorted(range(len(graph.edges)), key=weights.__getitem__)
+    total = 0
+    tree = []
+    for k in order:
+        u, v = graph.edges[k]
+        if dsu.union(u, v):
+            total += weights[k]
+            tree.append((u, v, weights[k]))
+            if len(tree) == n - 1:
+                break
+    return total, tree
+
+
+# Example Usage
+if __name__ == "__main__":
+    stream = StreamingConnectivityGraph()
+    stream.add_edge(0, 1)
+    stream.add_edge(2, 3)
+    print("0 ~ 3:", stream.connected(0, 3))   # Output: False
+    stream.add_edge(1, 2)
+    print("0 ~ 3:", stream.connected(0, 3))   # Output: True
+    print("Components:", stream.component_count())  # Output: 1
+    stream.add_edge("a", -1)
+    print("a ~ -1:", stream.connected("a", -1), stream.connected(0, "a"))  # Output: True False
+    print("Components:", stream.component_count())  # Output: 2
+
+    graph = Graph()
+    graph.add_edge(0, 1, 4)
+    graph.add_edge(0, 2, 1)
+    graph.add_edge(1, 2, 2)
+    graph.add_edge(1, 3, 5)
+    graph.add_edge(2, 3, 8)
+    print("MST:", kruskal_mst(graph))  # Output: (8, [(0, 2, 1), (1, 2, 2), (1, 3, 5)])
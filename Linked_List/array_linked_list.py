@@ -0,0 +1,179 @@
+from array import array
+
+
+class ArrayLinkedList:
+    # Singly linked list kept in parallel arrays instead of one Node object per element:
+    # slot i holds values[i] and next[i], the slot of the following element (-1 at the end).
+    # Deleted slots are chained through next into a free list and reused by later inserts,
+    # so the arrays never grow while elements are being replaced.
+    # With a typecode ('q', 'd', ...) the values are stored unboxed in an array as well.
+    def __init__(self, typecode=None):
+        self.values = [] if typecode is None else array(typecode)
+        self.next = array('q')
+        self.head = -1
+        self.tail = -1
+        self.free = -1 #first free slot, -1 if none
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, values, typecode=None):
+        ll = cls(typecode)
+        ll.extend(values)
+        return ll
+
+    def extend(self, values):
+        #New elements take fresh slots at the end of the arrays, already linked in order
+        start = len(self.next)
+        self.values.extend(values)
+        count = len(self.values) - start
+        if count == 0:
+            return
+        self.next.extend(range(start + 1, start + count + 1))
+        self.next[-1] = -1
+        if self.head == -1:
+            self.head = start
+        else:
+            self.next[self.tail] = start
+        self.tail = start + count - 1
+        self.length += count
+
+    def _allocate(self, data):
+        slot = self.free
+        if slot == -1:
+            self.values.append(data)
+            self.next.append(-1)
+            return len(self.next) - 1
+        self.free = self.next[slot]
+        self.values[slot] = data
+        self.next[slot] = -1
+        return slot
+
+    def _release(self, slot):
+        self.next[slot] = self.free
+        self.free = slot
+        if type(self.values) is list:
+            self.values[slot] = None #drop the reference so the value can be collected
+        self.length -= 1
+
+    def push_front(self, data):
+        slot = self._allocate(data)
+        self.next[slot] = self.head
+        self.head = slot
+        #If Linked List was empty
+        if self.tail == -1:
+            self.tail = slot
+        self.length += 1
+
+    def push_back(self, data):
+        slot = self._allocate(data)
+        #If Linked List is empty
+        if self.head == -1:
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+        self.length += 1
+
+    def insert_at_position(self, position, data):
+        if position == 0:
+            self.push_front(data)
+            return
+        #Walk to the slot before the position; positions past the end are ignored
+        prev = self.head
+        for i in range(position - 1):
+            if prev == -1:
+                return
+            prev = self.next[prev]
+        if prev == -1:
+            return
+        slot = self._allocate(data)
+        self.next[slot] = self.next[prev]
+        self.next[prev] = slot
+        if self.next[slot] == -1:
+            self.tail = slot
+        self.length += 1
+
+    def print_list(self):
+        current = self.head
+        while current != -1:
+            print(self.values[current], end=" ")
+            current = self.next[current]
+
+    def delete_node(self, key):
+        prev = -1
+        current = self.head
+        while current != -1 and self.values[current] != key:
+            prev = current
+            current = self.next[current]
+        #Means the key was not found
+        if current == -1:
+            return
+        if prev == -1:
+            self.head = self.next[current]
+        else:
+            self.next[prev] = self.next[current]
+        if current == self.tail:
+            self.tail = prev
+        self._release(current)
+
+    def pop_front(self):
+        if self.head == -1:
+            print("List is Empty")
+            return
+        slot = self.head
+        data = self.values[slot]
+        self.head = self.next[slot]
+        #If the list is now empty,update the tail too
+        if self.head == -1:
+            self.tail = -1
+        self._release(slot)
+        return data
+
+    def pop_back(self):
+        if self.head == -1:
+            print("List is Empty")
+            return
+        slot = self.tail
+        data = self.values[slot]
+        if self.head == slot:
+            # There is only one element in the list
+            self.head = self.tail = -1
+        else:
+            # Traverse to the second-last slot
+            prev = self.head
+            while self.next[prev] != slot:
+                prev = self.next[prev]
+            self.next[prev] = -1
+            self.tail = prev
+        self._release(slot)
+        return data
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = self.head
+        while current != -1:
+            yield self.values[current]
+            current = self.next[current]
+
+    def to_list(self):
+        return list(self)
+
+
+# Example usage:
+if __name__ == "__main__":
+    ll = ArrayLinkedList('q')
+    ll.push_back(20)
+    ll.push_back(30)
+    ll.push_front(10)
+    ll.insert_at_position(3, 40)
+    ll.print_list()  # Output: 10 20 30 40
+    print()
+
+    ll.delete_node(20)
+    print(ll.pop_back())   # Output: 40
+    ll.push_back(50)       # reuses a freed slot
+    ll.print_list()  # Output: 10 30 50
+    print()
+    print("Slots allocated:", len(ll.next))  # Output: 4
@@ -0,0 +1,65 @@
+import sys
+import time
+import tracemalloc
+
+import linkedlist
+from array_linked_list import ArrayLinkedList
+from linkedlist import LinkedList
+
+
+# linkedlist.Node as it was before nodes.py: a plain class with a per-instance __dict__
+class DictDoublyDataNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+def fill(build, values):
+    ll = build()
+    for value in values:
+        ll.push_back(value)
+    return ll
+
+
+def measure(build, values, node=None):
+    # Bytes allocated by the structure itself: the values exist before tracing starts,
+    # so only nodes, slots and arrays are counted. node swaps in another linkedlist.Node.
+    slotted = linkedlist.Node
+    if node is not None:
+        linkedlist.Node = node
+    try:
+        tracemalloc.start()
+        ll = fill(build, values)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del ll
+        start = time.perf_counter()
+        fill(build, values)
+        return size, time.perf_counter() - start
+    finally:
+        linkedlist.Node = slotted
+
+
+def run(n):
+    values = [i * 1000 for i in range(n)]
+    print(f"n = {n:,} elements")
+    print(f"{'structure':<30}{'bytes/element':>15}{'total MB':>12}{'build s':>10}")
+    rows = [
+        ("LinkedList (dict-based Node)", LinkedList, DictDoublyDataNode),
+        ("LinkedList (slotted Node)", LinkedList, None),
+        ("ArrayLinkedList()", ArrayLinkedList, None),
+        ("ArrayLinkedList('q')", lambda: ArrayLinkedList('q'), None),
+    ]
+    baseline = None
+    for name, build, node in rows:
+        size, seconds = measure(build, values, node)
+        baseline = baseline or size
+        print(f"{name:<30}{size / n:>15.1f}{size / 1e6:>12.1f}{seconds:>10.2f}  ({baseline / size:.1f}x smaller)")
+    print()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000]
+    for n in sizes:
+        run(n)
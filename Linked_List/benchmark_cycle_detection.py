@@ -0,0 +1,122 @@
+import sys
+import time
+
+from cycle_analysis import analyze_cycle, analyze_cycles, remove_cycle
+from detect_a_cycle import ListNode, hasCycle
+from remove_a_cycle import removeCycle
+
+
+def build(n, entry):
+    # n nodes; the last one links back to node `entry` (no cycle if entry is None)
+    head = tail = ListNode(0)
+    target = head if entry == 0 else None
+    for i in range(1, n):
+        tail.next = ListNode(0)
+        tail = tail.next
+        if i == entry:
+            target = tail
+    tail.next = target
+    return head
+
+
+def floyd_steps(head):
+    # Pointer moves made by hasCycle + the start search of removeCycle
+    steps = 0
+    slow = fast = head
+    while fast and fast.next:
+        slow = slow.next
+        fast = fast.next.next
+        steps += 3
+        if slow is fast:
+            break
+    else:
+        return steps
+    slow = head
+    while slow is not fast:
+        slow = slow.next
+        fast = fast.next
+        steps += 2
+    return steps
+
+
+def brent_steps(head):
+    # Pointer moves made by analyze_cycle
+    steps = 0
+    power = lam = 1
+    tortoise = head
+    hare = head.next
+    while hare is not tortoise:
+        if hare is None:
+            return steps
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = hare.next
+        lam += 1
+        steps += 1
+    tortoise = hare = head
+    for _ in range(lam):
+        hare = hare.next
+    steps += lam
+    while tortoise is not hare:
+        tortoise = tortoise.next
+        hare = hare.next
+        steps += 2
+    return steps
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def close(head, entry):
+    # Re-link the last node to node `entry` after a removal cut the cycle
+    target = head
+    for _ in range(entry):
+        target = target.next
+    last = target
+    while last.next:
+        last = last.next
+    last.next = target
+
+
+def run(n, entry):
+    shape = "no cycle" if entry is None else f"tail {entry:,}, cycle {n - entry:,}"
+    head = build(n, entry)
+    print(f"n = {n:,} ({shape})")
+    print(f"{'algorithm':<24}{'pointer steps':>15}{'seconds':>10}")
+    found, seconds = timed(hasCycle, head)
+    print(f"{'Floyd hasCycle':<24}{'':>15}{seconds:>10.2f}")
+    steps = floyd_steps(head)
+    _, seconds = timed(removeCycle, head)
+    print(f"{'Floyd removeCycle':<24}{steps:>15,}{seconds:>10.2f}")
+    if found:
+        close(head, entry)
+    steps = brent_steps(head)
+    info, seconds = timed(analyze_cycle, head)
+    print(f"{'Brent analyze_cycle':<24}{steps:>15,}{seconds:>10.2f}")
+    assert (info.start is not None) == found
+    assert info.length == (0 if entry is None else n - entry)
+    assert info.tail == (n if entry is None else entry)
+    _, seconds = timed(remove_cycle, head)
+    print(f"{'Brent remove_cycle':<24}{'':>15}{seconds:>10.2f}")
+    print()
+
+
+def run_batch(count, n):
+    # Many short lists, half of them cyclic
+    heads = [build(n, None if i % 2 else i % n) for i in range(count)]
+    results, seconds = timed(analyze_cycles, heads)
+    cyclic = sum(1 for info in results if info.start is not None)
+    print(f"analyze_cycles over {count:,} lists of {n} nodes: {cyclic:,} cyclic, {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    run(n, n // 2)
+    run(n, n - 10)
+    run(n, None)
+    run_batch(100_000, 20)
@@ -0,0 +1,70 @@
+from collections import namedtuple
+
+# start: first node of the cycle (None if the list ends)
+# length: number of nodes in the cycle (0 if the list ends)
+# tail: number of nodes before the cycle (the whole list length if the list ends)
+CycleInfo = namedtuple('CycleInfo', ['start', 'length', 'tail'])
+
+
+def analyze_cycle(head):
+    # Brent's algorithm: the tortoise teleports to the hare whenever the hare has made
+    # a power-of-two number of steps, so the hare alone finds the cycle length (no
+    # second pointer walking behind it). Then two pointers lam apart find the start.
+    # One pointer move per detection step (Floyd makes three), O(1) extra space.
+    if head is None:
+        return CycleInfo(None, 0, 0)
+    power = lam = 1
+    steps = 1 #position of the hare
+    tortoise = head
+    hare = head.next
+    while hare is not tortoise:
+        if hare is None:
+            return CycleInfo(None, 0, steps)
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = hare.next
+        lam += 1
+        steps += 1
+    # Start the hare lam nodes ahead; both then meet exactly at the cycle start
+    tortoise = hare = head
+    for _ in range(lam):
+        hare = hare.next
+    mu = 0
+    while tortoise is not hare:
+        tortoise = tortoise.next
+        hare = hare.next
+        mu += 1
+    return CycleInfo(tortoise, lam, mu)
+
+
+def remove_cycle(head):
+    # Cut the link that closes the cycle; returns the CycleInfo found before the cut
+    info = analyze_cycle(head)
+    if info.start is not None:
+        last = info.start
+        for _ in range(info.length - 1):
+            last = last.next
+        last.next = None
+    return info
+
+
+def analyze_cycles(heads):
+    # Batch mode: one CycleInfo per list head
+    return [analyze_cycle(head) for head in heads]
+
+
+# Example usage:
+if __name__ == "__main__":
+    from zig_zag_ll import from_iterable
+
+    head = from_iterable([3, 2, 0, -4])
+    head.next.next.next.next = head.next  # -4 -> 2 closes the cycle
+    info = analyze_cycle(head)
+    print(info.start.val, info.length, info.tail)  # Output: 2 3 1
+
+    remove_cycle(head)
+    print(analyze_cycle(head).tail)  # Output: 4
+
+    print([info.length for info in analyze_cycles([head, None, from_iterable([1])])])  # Output: [0, 0, 0]
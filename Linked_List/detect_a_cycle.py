@@ -1,7 +1,4 @@
-class ListNode:
-    def __init__(self, val=0, next=None):
-        self.val = val
-        self.next = next
+from nodes import ListNode
 
 def hasCycle(head):
     slow = fast = head
@@ -12,17 +9,18 @@ def hasCycle(head):
             return True           # cycle detected
     return False                  # no cycle
 
-# Step 1: Create nodes
-node1 = ListNode(3)
-node2 = ListNode(2)
-node3 = ListNode(0)
-node4 = ListNode(-4)
+if __name__ == "__main__":
+    # Step 1: Create nodes
+    node1 = ListNode(3)
+    node2 = ListNode(2)
+    node3 = ListNode(0)
+    node4 = ListNode(-4)
 
-# Step 2: Link nodes
-node1.next = node2
-node2.next = node3
-node3.next = node4
-node4.next = node2  # cycle here
+    # Step 2: Link nodes
+    node1.next = node2
+    node2.next = node3
+    node3.next = node4
+    node4.next = node2  # cycle here
 
-# Step 3: Check for cycle
-print(hasCycle(node1))  # Output: True
\ No newline at end of file
+    # Step 3: Check for cycle
+    print(hasCycle(node1))  # Output: True
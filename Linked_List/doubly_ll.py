@@ -1,12 +1,38 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.prev = None
-        self.next = None
+from nodes import DoublyListNode as Node
 
 class DoublyLinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, values):
+        dll = cls()
+        dll.extend(values)
+        return dll
+
+    # Link all new nodes in one pass, then attach the chain after the tail
+    def extend(self, values):
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for val in values:
+            new_node = Node(val)
+            new_node.prev = tail
+            tail.next = new_node
+            tail = new_node
+            count += 1
+        if count == 0:
+            return
+        first = dummy.next
+        first.prev = self.tail
+        if self.head:
+            self.tail.next = first
+        else:
+            self.head = first
+        self.tail = tail
+        self.length += count
 
     # Push to front
     def push_front(self, val):
@@ -14,7 +40,10 @@ class DoublyLinkedList:
         new_node.next = self.head
         if self.head:
             self.head.prev = new_node
+        else:
+            self.tail = new_node
         self.head = new_node
+        self.length += 1
 
     # Pop from front
     def pop_front(self):
@@ -25,8 +54,23 @@ class DoublyLinkedList:
         self.head = self.head.next
         if self.head:
             self.head.prev = None
+        else:
+            self.tail = None
+        self.length -= 1
         return val
 
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield curr.val
+            curr = curr.next
+
+    def to_list(self):
+        return list(self)
+
     def display(self):
         curr = self.head
         while curr:
@@ -34,12 +78,16 @@ class DoublyLinkedList:
             curr = curr.next
         print("None")
 
-dll = DoublyLinkedList()
+if __name__ == "__main__":
+    dll = DoublyLinkedList()
+
+    dll.push_front(10)
+    dll.push_front(20)
+    dll.push_front(30)
+    dll.display()     # Output: 30 <-> 20 <-> 10 <-> None
 
-dll.push_front(10)
-dll.push_front(20)
-dll.push_front(30)
-dll.display()     # Output: 30 <-> 20 <-> 10 <-> None
+    print(dll.pop_front())  # Output: 30
+    dll.display()           # Output: 20 <-> 10 <-> None
 
-print(dll.pop_front())  # Output: 30
-dll.display()           # Output: 20 <-> 10 <-> None
\ No newline at end of file
+    dll.extend([5, 0])
+    print(len(dll), dll.to_list())  # Output: 4 [20, 10, 5, 0]
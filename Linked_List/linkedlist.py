@@ -1,23 +1,61 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+from nodes import DoublyDataNode as Node
+from skip_index import SkipIndex
 
 class LinkedList:
-    def __init__(self):
+    #prev pointers make pop_back O(1); indexed=True adds a skip index so that
+    #get / insert_at_position run in O(log n) expected instead of O(position)
+    def __init__(self, indexed=False):
         self.head = None
         self.tail = None
-    
+        self.length = 0
+        self.index = SkipIndex() if indexed else None
+
+    @classmethod
+    def from_iterable(cls, values, indexed=False):
+        ll = cls(indexed)
+        ll.extend(values)
+        return ll
+
+    def extend(self, values):
+        #Link all new nodes in one pass, then attach the chain after the tail
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for data in values:
+            new_node = Node(data)
+            new_node.prev = tail
+            tail.next = new_node
+            tail = new_node
+            count += 1
+        if count == 0:
+            return
+        first = dummy.next
+        first.prev = self.tail
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = tail
+        if self.index is not None:
+            node = first
+            for position in range(self.length, self.length + count):
+                self.index.insert(position, node)
+                node = node.next
+        self.length += count
+
     def push_front(self,data):
         new_node = Node(data)
         #If Linked List is empty
         if self.head is None:
             self.head = new_node
             self.tail = new_node
-            return
-        
-        new_node.next = self.head
-        self.head = new_node
+        else:
+            new_node.next = self.head
+            self.head.prev = new_node
+            self.head = new_node
+        if self.index is not None:
+            self.index.insert(0, new_node)
+        self.length += 1
 
     def push_back(self,data):
         new_node = Node(data)
@@ -25,30 +63,51 @@ class LinkedList:
         if self.head is None:
             self.head = new_node
             self.tail = new_node
-            return
         else:
+            new_node.prev = self.tail
             self.tail.next = new_node
             self.tail = new_node
+        if self.index is not None:
+            self.index.insert(self.length, new_node)
+        self.length += 1
+
+    def _node_at(self, position):
+        #Start from the closest indexed node (or the head) and walk the rest
+        temp, at = None, -1
+        if self.index is not None:
+            temp, at = self.index.find(position)
+        if temp is None:
+            temp, at = self.head, 0
+        for i in range(position - at):
+            temp = temp.next
+        return temp
+
+    def get(self, position):
+        if not 0 <= position < self.length:
+            raise IndexError("list index out of range")
+        return self._node_at(position).data
 
     def insert_at_position(self,position,data):
-        new_node = Node(data)
+        #Positions past the end are ignored
+        if position < 0 or position > self.length:
+            return
         #1 st Case
         if position == 0:
-            new_node.next=self.head
-            self.head = new_node
-            if self.tail is None:
-                self.tail = new_node
+            self.push_front(data)
+            return
+        if position == self.length:
+            self.push_back(data)
             return
         #2nd Case
-        temp=self.head
-        for i in range(position-1):
-            if temp is None:
-                return
-            temp=temp.next
-        new_node.next=temp.next
+        temp = self._node_at(position - 1)
+        new_node = Node(data)
+        new_node.next = temp.next
+        new_node.prev = temp
+        temp.next.prev = new_node
         temp.next = new_node
-        if new_node.next is None:
-            self.tail = new_node
+        if self.index is not None:
+            self.index.insert(position, new_node)
+        self.length += 1
 
     def print_list(self):
         current_node = self.head
@@ -56,62 +115,70 @@ class LinkedList:
             print(current_node.data, end=" ")
             current_node = current_node.next
 
+    def _unlink(self, node, position):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        if self.index is not None:
+            self.index.remove(position, node)
+        node.next = node.prev = None
+        self.length -= 1
+
     def delete_node(self,key):
-        temp=self.head
-        if temp is not None:
-            if temp.data == key:
-                self.head = temp.next
-                if self.head is None:
-                    self.tail = None
-                temp=None
-                return
+        temp = self.head
+        position = 0
         while temp is not None:
             if temp.data == key:
                 break
-            prev=temp
-            temp=temp.next
+            temp = temp.next
+            position += 1
         #Means the key was not found
         if temp is None:
             return
-        prev.next = temp.next
-        if temp == self.tail:
-            self.tail = prev
-        #By setting it to None we are efficitevely deleting the node.
-        temp = None
+        self._unlink(temp, position)
 
     def pop_front(self):
         if self.head is None:
             print("List is Empty")
-            return 
-        
-        temp=self.head
-        self.head = temp.next
-
-        #If the list is now empty,update the tail to None
-        if self.head is None:
-            self.tail = None
-        temp.next=None
+            return
+        data = self.head.data
+        self._unlink(self.head, 0)
+        return data
 
     def pop_back(self):
         if self.head is None:
             print("List is Empty")
             return
-        
-        if self.head.next is None:
-            # There is only one element in the list
-            temp = self.head
-            self.head = None
-            self.tail = None
-            temp = None
-            return
-        
-        # Traverse to the second-last node
-        temp = self.head
-        while temp.next.next is not None:
-            temp = temp.next
-        
-        # Remove the last node
-        to_delete = temp.next
-        temp.next = None
-        self.tail = temp
-        to_delete = None
\ No newline at end of file
+        #The tail knows the second-last node, so no traversal is needed
+        data = self.tail.data
+        self._unlink(self.tail, self.length - 1)
+        return data
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current_node = self.head
+        while current_node:
+            yield current_node.data
+            current_node = current_node.next
+
+    def to_list(self):
+        return list(self)
+
+# Example usage:
+if __name__ == "__main__":
+    ll = LinkedList.from_iterable([10, 20, 30, 40, 50], indexed=True)
+    ll.insert_at_position(2, 25)
+    ll.print_list()  # Output: 10 20 25 30 40 50
+    print()
+
+    print(ll.pop_back())  # Output: 50
+    print(ll.get(3))      # Output: 30
+    ll.extend([60, 70])
+    print(len(ll), ll.to_list())  # Output: 7 [10, 20, 25, 30, 40, 60, 70]
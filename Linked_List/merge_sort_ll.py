@@ -1,7 +1,6 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+import operator
+
+from nodes import ListNode as Node
 
 # Helper function to merge two sorted linked lists
 def merge(l1, l2):
@@ -30,15 +29,92 @@ def get_middle(head):
         prev.next = None  # Split the list
     return slow
 
-# Merge sort function
-def merge_sort(head):
+# Top-down merge sort: splits at the middle and recurses (depth log n)
+def merge_sort_recursive(head):
     if not head or not head.next:
         return head
     mid = get_middle(head)
-    left = merge_sort(head)
-    right = merge_sort(mid)
+    left = merge_sort_recursive(head)
+    right = merge_sort_recursive(mid)
     return merge(left, right)
 
+# Reverse a list in place and return the new head
+def reverse_list(head):
+    prev = None
+    while head:
+        following = head.next
+        head.next = prev
+        prev = head
+        head = following
+    return prev
+
+# Cut the sorted run starting at head off the list: returns (run head, rest).
+# A strictly decreasing run is reversed in place instead (it has no equal
+# values, so reversing it keeps the sort stable).
+def take_run(head, less):
+    node = head
+    if node.next and less(node.next.val, node.val):
+        prev = None
+        while True:
+            following = node.next
+            node.next = prev
+            prev = node
+            if following is None or not less(following.val, node.val):
+                return node, following
+            node = following
+    while node.next and not less(node.next.val, node.val):
+        node = node.next
+    rest = node.next
+    node.next = None
+    return head, rest
+
+# Stable merge of two runs: on ties the node from a (the earlier run) goes first
+def merge_runs(a, b, less):
+    dummy = Node(None)
+    tail = dummy
+    while a and b:
+        if less(b.val, a.val):
+            tail.next = b
+            b = b.next
+        else:
+            tail.next = a
+            a = a.next
+        tail = tail.next
+    tail.next = a or b
+    return dummy.next
+
+# Bottom-up natural merge sort without recursion. The list is cut into its sorted runs
+# in one pass; runs are merged like carries in a binary counter, so pending[i] holds
+# 2^i merged runs. That is the only extra space: at most log2(n) list heads.
+# A list made of r runs costs O(n log r): sorted or reverse sorted input takes one O(n) scan.
+# key and reverse work like sorted(); equal elements keep their order either way.
+def merge_sort(head, key=None, reverse=False):
+    if not head or not head.next:
+        return head
+    less = operator.lt if key is None else (lambda x, y: key(x) < key(y))
+    # Stable descending order = reverse, stable ascending sort, reverse again
+    if reverse:
+        head = reverse_list(head)
+    pending = []
+    rest = head
+    while rest:
+        run, rest = take_run(rest, less)
+        i = 0
+        # Higher slots hold earlier runs, so they go first in every merge
+        while i < len(pending) and pending[i] is not None:
+            run = merge_runs(pending[i], run, less)
+            pending[i] = None
+            i += 1
+        if i == len(pending):
+            pending.append(run)
+        else:
+            pending[i] = run
+    head = None
+    for run in pending:
+        if run is not None:
+            head = run if head is None else merge_runs(run, head, less)
+    return reverse_list(head) if reverse else head
+
 
 def print_list(head):
     while head:
@@ -46,16 +122,25 @@ def print_list(head):
         head = head.next
     print("None")
 
-# Creating unsorted linked list
-a = Node(4)
-b = Node(2)
-c = Node(1)
-d = Node(3)
+if __name__ == "__main__":
+    # Creating unsorted linked list
+    a = Node(4)
+    b = Node(2)
+    c = Node(1)
+    d = Node(3)
+
+    a.next = b
+    b.next = c
+    c.next = d
 
-a.next = b
-b.next = c
-c.next = d
+    # Sort the list
+    sorted_head = merge_sort(a)
+    print_list(sorted_head)  # Output: 1 -> 2 -> 3 -> 4 -> None
 
-# Sort the list
-sorted_head = merge_sort(a)
-print_list(sorted_head)  # Output: 1 -> 2 -> 3 -> 4 -> None
\ No newline at end of file
+    # Descending by absolute value; -3 stays ahead of 3
+    head = None
+    for val in [1, 3, -2, -3, 5]:
+        node = Node(val)
+        node.next = head
+        head = node
+    print_list(merge_sort(head, key=abs, reverse=True))  # Output: 5 -> -3 -> 3 -> -2 -> 1 -> None
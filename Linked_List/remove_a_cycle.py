@@ -1,7 +1,4 @@
-class ListNode:
-    def __init__(self, val=0):
-        self.val = val
-        self.next = None
+from nodes import ListNode
 
 def removeCycle(head):
     slow = fast = head
@@ -26,22 +23,6 @@ def removeCycle(head):
     # Step 3: Remove the cycle
     prev.next = None
 
-# Example usage:
-# Create nodes
-node1 = ListNode(3)
-node2 = ListNode(2)
-node3 = ListNode(0)
-node4 = ListNode(-4)
-
-# Connect nodes to form a cycle
-node1.next = node2
-node2.next = node3
-node3.next = node4
-node4.next = node2  # cycle here
-
-removeCycle(node1)
-
-# Traverse to confirm cycle is removed
 def printList(head):
     visited = set()
     while head:
@@ -54,4 +35,21 @@ def printList(head):
     else:
         print("None")
 
-printList(node1)  # Output: 3 → 2 → 0 → -4 → None
\ No newline at end of file
+# Example usage:
+if __name__ == "__main__":
+    # Create nodes
+    node1 = ListNode(3)
+    node2 = ListNode(2)
+    node3 = ListNode(0)
+    node4 = ListNode(-4)
+
+    # Connect nodes to form a cycle
+    node1.next = node2
+    node2.next = node3
+    node3.next = node4
+    node4.next = node2  # cycle here
+
+    removeCycle(node1)
+
+    # Traverse to confirm cycle is removed
+    printList(node1)  # Output: 3 → 2 → 0 → -4 → None
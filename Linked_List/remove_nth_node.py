@@ -1,21 +1,56 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+from nodes import DataNode as Node
 
 class LinkedList:
     def __init__(self):
         self.head = None
         self.tail = None
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, values):
+        ll = cls()
+        ll.extend(values)
+        return ll
+
+    def extend(self, values):
+        # Link the new nodes in one pass, then attach the chain after the tail
+        dummy = Node(0)
+        tail = dummy
+        count = 0
+        for data in values:
+            tail.next = Node(data)
+            tail = tail.next
+            count += 1
+        if count == 0:
+            return
+        if not self.head:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = tail
+        self.length += count
 
     def push_back(self, data):
         new_node = Node(data)
+        self.length += 1
         if not self.head:
             self.head = self.tail = new_node
             return
         self.tail.next = new_node
         self.tail = new_node
 
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        temp = self.head
+        while temp:
+            yield temp.data
+            temp = temp.next
+
+    def to_list(self):
+        return list(self)
+
     def print_list(self):
         temp = self.head
         while temp:
@@ -44,15 +79,14 @@ class LinkedList:
         if to_delete == self.head:
             self.head = self.head.next
         if to_delete == self.tail:
-            self.tail = second if second.next is None else self.tail
+            self.tail = second if second is not dummy else None
+        self.length -= 1
 
         to_delete = None
 
 # Example usage:
 if __name__ == "__main__":
-    ll = LinkedList()
-    for val in [10, 20, 30, 40, 50]:
-        ll.push_back(val)
+    ll = LinkedList.from_iterable([10, 20, 30, 40, 50])
 
     print("Original list:")
     ll.print_list()
@@ -62,4 +96,5 @@ if __name__ == "__main__":
     ll.remove_nth_from_end(n)
 
     print("Updated list:")
-    ll.print_list()
\ No newline at end of file
+    ll.print_list()
+    print(len(ll), ll.to_list())  # Output: 4 [10, 20, 30, 50]
\ No newline at end of file
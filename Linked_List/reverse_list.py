@@ -1,16 +1,40 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+from nodes import DataNode as Node
 
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, values):
+        # Link the nodes in one pass, keeping the order of values
+        ll = cls()
+        dummy = Node(0)
+        tail = dummy
+        for data in values:
+            tail.next = Node(data)
+            tail = tail.next
+            ll.length += 1
+        ll.head = dummy.next
+        return ll
 
     def push_front(self, data):
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        self.length += 1
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def to_list(self):
+        return list(self)
 
     def print_list(self):
         current = self.head
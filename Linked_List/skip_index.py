@@ -0,0 +1,80 @@
+import random
+
+
+class Lane:
+    # One link of an express level: node, the next entry on the same level (right),
+    # how many list positions that link skips (width) and the same node one level down
+    __slots__ = ('node', 'right', 'width', 'down')
+
+    def __init__(self, node, right, width, down):
+        self.node = node
+        self.right = right
+        self.width = width
+        self.down = down
+
+
+class SkipIndex:
+    # Indexable skip list over the nodes of a linked list, giving O(log n) expected
+    # positional lookup, insert and delete. The linked list itself is the bottom level;
+    # each express level links a random half of the nodes of the level below.
+    # heads[k] is the head entry (before position 0) of express level k, heads[-1] the top.
+    def __init__(self):
+        self.heads = []
+
+    def _path(self, pos):
+        # Last entry before position pos on every level (lowest level first), with its position
+        path = []
+        entry = self.heads[-1] if self.heads else None
+        at = -1
+        while entry is not None:
+            while entry.right is not None and at + entry.width < pos:
+                at += entry.width
+                entry = entry.right
+            path.append((entry, at))
+            entry = entry.down
+        path.reverse()
+        return path
+
+    def find(self, pos):
+        # Last indexed node at or before position pos and its position; (None, -1) if none.
+        # The caller walks the remaining (expected < 2) steps along node.next.
+        entry = self.heads[-1] if self.heads else None
+        at = -1
+        while entry is not None:
+            while entry.right is not None and at + entry.width <= pos:
+                at += entry.width
+                entry = entry.right
+            if entry.down is None:
+                return entry.node, at
+            entry = entry.down
+        return None, -1
+
+    def insert(self, pos, node):
+        # node has just been linked in at position pos; later positions moved up by one
+        height = 0
+        while height <= len(self.heads) and random.random() < 0.5:
+            height += 1
+        while len(self.heads) < height:
+            self.heads.append(Lane(None, None, 0, self.heads[-1] if self.heads else None))
+        below = None
+        for level, (entry, at) in enumerate(self._path(pos)):
+            if level < height:
+                width = at + entry.width + 1 - pos if entry.right is not None else 0
+                below = Lane(node, entry.right, width, below)
+                entry.right = below
+                entry.width = pos - at
+            elif entry.right is not None:
+                entry.width += 1
+
+    def remove(self, pos, node):
+        # node at position pos is being unlinked; later positions move down by one
+        for entry, at in self._path(pos):
+            right = entry.right
+            if right is not None and right.node is node:
+                entry.right = right.right
+                entry.width = entry.width + right.width - 1 if entry.right is not None else 0
+            elif right is not None:
+                entry.width -= 1
+        # Drop express levels that no longer link anything
+        while self.heads and self.heads[-1].right is None:
+            self.heads.pop()
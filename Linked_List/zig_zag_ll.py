@@ -1,7 +1,20 @@
-class Node:
-    def __init__(self, val):
-        self.val = val
-        self.next = None
+from nodes import ListNode as Node
+
+# Build a list from any iterable in one pass; returns the head
+def from_iterable(values):
+    dummy = Node(0)
+    tail = dummy
+    for val in values:
+        tail.next = Node(val)
+        tail = tail.next
+    return dummy.next
+
+def to_list(head):
+    values = []
+    while head:
+        values.append(head.val)
+        head = head.next
+    return values
 
 def find_middle(head):
     slow = fast = head
@@ -38,22 +51,19 @@ def zigzag_reorder(head):
         first = temp1
         second = temp2
 
-# List: 1 → 2 → 3 → 4 → 5
-# Output: 1 → 5 → 2 → 4 → 3
-
-a = Node(1)
-b = Node(2)
-c = Node(3)
-d = Node(4)
-e = Node(5)
-a.next = b; b.next = c; c.next = d; d.next = e
-
-zigzag_reorder(a)
-
 def print_list(head):
     while head:
         print(head.val, end=" -> ")
         head = head.next
     print("None")
 
-print_list(a)
\ No newline at end of file
+if __name__ == "__main__":
+    # List: 1 → 2 → 3 → 4 → 5
+    # Output: 1 → 5 → 2 → 4 → 3
+
+    a = from_iterable([1, 2, 3, 4, 5])
+
+    zigzag_reorder(a)
+
+    print_list(a)
+    print(to_list(a))  # Output: [1, 5, 2, 4, 3]
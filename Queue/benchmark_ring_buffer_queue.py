@@ -0,0 +1,93 @@
+import sys
+import time
+from array import array
+from collections import deque
+
+from circular_queue_array import CircularQueue
+from ring_buffer_queue import RingBufferQueue
+
+
+# Producer/consumer pipeline: push a batch, pop it, sum it (the consumer's work)
+def circular_queue(total, batch):
+    q = CircularQueue(batch)
+    checksum = 0
+    for start in range(0, total, batch):
+        for value in range(start, start + batch):
+            q.enqueue(value)
+        for _ in range(batch):
+            checksum += q.dequeue()
+    return checksum
+
+
+def deque_queue(total, batch):
+    q = deque()
+    checksum = 0
+    for start in range(0, total, batch):
+        q.extend(range(start, start + batch))
+        checksum += sum([q.popleft() for _ in range(batch)])
+    return checksum
+
+
+def ring_single(total, batch):
+    q = RingBufferQueue()
+    checksum = 0
+    for start in range(0, total, batch):
+        for value in range(start, start + batch):
+            q.enqueue(value)
+        for _ in range(batch):
+            checksum += q.dequeue()
+    return checksum
+
+
+def ring_many(total, batch, typecode=None):
+    q = RingBufferQueue(typecode)
+    checksum = 0
+    for start in range(0, total, batch):
+        q.enqueue_many(range(start, start + batch))
+        checksum += sum(q.dequeue_many(batch))
+    return checksum
+
+
+def ring_many_typed(total, batch):
+    return ring_many(total, batch, 'q')
+
+
+def ring_many_typed_array(total, batch):
+    # The producer already holds its batch in an array('q'), so enqueue_many is a memcpy
+    q = RingBufferQueue('q')
+    records = array('q', range(batch))
+    checksum = 0
+    for _ in range(0, total, batch):
+        q.enqueue_many(records)
+        checksum += sum(q.dequeue_many(batch))
+    return checksum
+
+
+QUEUES = [
+    ("CircularQueue enqueue/dequeue", circular_queue),
+    ("deque extend/popleft", deque_queue),
+    ("RingBufferQueue enqueue/dequeue", ring_single),
+    ("RingBufferQueue *_many", ring_many),
+    ("RingBufferQueue('q') *_many", ring_many_typed),
+    ("  (batches already in arrays)", ring_many_typed_array),
+]
+
+
+def run(total, batch):
+    print(f"{total:,} records in batches of {batch:,}")
+    for name, pipeline in QUEUES:
+        if pipeline is ring_many_typed_array:
+            expected = total // batch * (batch * (batch - 1) // 2)
+        else:
+            expected = total * (total - 1) // 2
+        start = time.perf_counter()
+        checksum = pipeline(total, batch)
+        seconds = time.perf_counter() - start
+        assert checksum == expected
+        print(f"{name:<34}{seconds:>8.2f} s")
+    print()
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    run(total, 10_000)
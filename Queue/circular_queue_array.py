@@ -38,14 +38,15 @@ class CircularQueue:
             print("Circular Queue elements:", queue_elements)
 
 # Example usage
-q = CircularQueue(5)
-q.enqueue(1)
-q.enqueue(2)
-q.enqueue(3)
-q.enqueue(4)
-q.enqueue(5)
-q.display()
-print("Dequeued:", q.dequeue())
-q.display()
-q.enqueue(6)
-q.display()
+if __name__ == "__main__":
+    q = CircularQueue(5)
+    q.enqueue(1)
+    q.enqueue(2)
+    q.enqueue(3)
+    q.enqueue(4)
+    q.enqueue(5)
+    q.display()
+    print("Dequeued:", q.dequeue())
+    q.display()
+    q.enqueue(6)
+    q.display()
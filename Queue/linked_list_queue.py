@@ -1,7 +1,4 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+from nodes import DataNode as Node
 
 class Queue:
     def __init__(self):
@@ -43,11 +40,12 @@ class Queue:
         print()
 
 # Example usage:
-queue = Queue()
-queue.enqueue(10)
-queue.enqueue(20)
-queue.enqueue(30)
-queue.display()  # Output: 10 20 30
-print("Front element is:", queue.peek())  # Output: Front element is: 10
-queue.dequeue()
-queue.display()  
\ No newline at end of file
+if __name__ == "__main__":
+    queue = Queue()
+    queue.enqueue(10)
+    queue.enqueue(20)
+    queue.enqueue(30)
+    queue.display()  # Output: 10 20 30
+    print("Front element is:", queue.peek())  # Output: Front element is: 10
+    queue.dequeue()
+    queue.display()
@@ -0,0 +1,139 @@
+from array import array
+
+
+class RingBufferQueue:
+    # Growable circular queue. The capacity is always a power of two, so wrapping is
+    # `& mask` instead of `% size`, and a length counter tells full from empty (no
+    # wasted slot). When full, the buffer doubles instead of refusing the element.
+    # RingBufferQueue('q') / ('d') ... stores values unboxed in an array.
+    def __init__(self, typecode=None, capacity=16):
+        self.typecode = typecode
+        self.capacity = 1
+        while self.capacity < capacity:
+            self.capacity *= 2
+        self.mask = self.capacity - 1
+        self.buffer = self.allocate(self.capacity)
+        self.front = 0
+        self.length = 0
+
+    def allocate(self, capacity):
+        if self.typecode is None:
+            return [None] * capacity
+        return array(self.typecode, [0]) * capacity
+
+    # Move the elements to a buffer of at least `needed` slots, unwrapped at index 0
+    def grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        buffer = self.allocate(capacity)
+        first = min(self.length, self.capacity - self.front)
+        buffer[:first] = self.buffer[self.front:self.front + first]
+        buffer[first:self.length] = self.buffer[:self.length - first]
+        self.buffer = buffer
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.front = 0
+
+    def enqueue(self, value):
+        if self.length == self.capacity:
+            self.grow(self.length + 1)
+        self.buffer[(self.front + self.length) & self.mask] = value
+        self.length += 1
+
+    def dequeue(self):
+        if self.length == 0:
+            print("Ring Buffer Queue is empty")
+            return None
+        value = self.buffer[self.front]
+        if self.typecode is None:
+            self.buffer[self.front] = None
+        self.front = (self.front + 1) & self.mask
+        self.length -= 1
+        return value
+
+    def peek(self):
+        if self.length == 0:
+            print("Ring Buffer Queue is empty")
+            return None
+        return self.buffer[self.front]
+
+    # Copy a whole batch in with at most two slice assignments
+    def enqueue_many(self, values):
+        if self.typecode is None:
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+        elif (isinstance(values, memoryview) and values.format == self.typecode
+              and values.c_contiguous):
+            chunk = array(self.typecode)
+            chunk.frombytes(values.cast('B'))
+            values = chunk
+        elif not (isinstance(values, array) and values.typecode == self.typecode):
+            values = array(self.typecode, values)
+        count = len(values)
+        if count == 0:
+            return
+        if self.length + count > self.capacity:
+            self.grow(self.length + count)
+        rear = (self.front + self.length) & self.mask
+        first = min(count, self.capacity - rear)
+        self.buffer[rear:rear + first] = values[:first]
+        if first < count:
+            self.buffer[:count - first] = values[first:]
+        self.length += count
+
+    # Remove up to n elements (all if n is None). A typed queue returns a memoryview
+    # into the buffer when they are contiguous (no copy) and an array when they wrap;
+    # an untyped queue returns a list. A view is only valid until the next enqueue,
+    # which may reuse its slots: call .tolist() or bytes() on it to keep the data.
+    def dequeue_many(self, n=None):
+        count = self.length if n is None else max(0, min(n, self.length))
+        start = self.front
+        end = start + count
+        if self.typecode is None:
+            if end <= self.capacity:
+                batch = self.buffer[start:end]
+                self.buffer[start:end] = [None] * count
+            else:
+                end -= self.capacity
+                batch = self.buffer[start:] + self.buffer[:end]
+                self.buffer[start:] = [None] * (self.capacity - start)
+                self.buffer[:end] = [None] * end
+        elif end <= self.capacity:
+            batch = memoryview(self.buffer)[start:end]
+        else:
+            batch = self.buffer[start:] + self.buffer[:end - self.capacity]
+        self.front = end & self.mask
+        self.length -= count
+        return batch
+
+    def is_empty(self):
+        return self.length == 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.buffer[(self.front + i) & self.mask]
+
+    def display(self):
+        if self.length == 0:
+            print("No element in the Ring Buffer Queue")
+        else:
+            print("Ring Buffer Queue elements:", list(self))
+
+
+# Example usage
+if __name__ == "__main__":
+    q = RingBufferQueue(capacity=4)
+    for i in range(1, 6):
+        q.enqueue(i)  # the fifth element doubles the buffer instead of failing
+    q.display()       # Ring Buffer Queue elements: [1, 2, 3, 4, 5]
+    print("Dequeued:", q.dequeue())  # Dequeued: 1
+
+    records = RingBufferQueue('q')
+    records.enqueue_many(range(10_000))
+    batch = records.dequeue_many(4_000)   # memoryview, no copy
+    print(len(batch), batch[0], batch[-1])  # 4000 0 3999
+    print(len(records), records.capacity)   # 6000 16384
@@ -0,0 +1,52 @@
+import random
+import sys
+import time
+
+from fenwick_tree import FenwickTree
+from segment_tree import SegmentTree
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(n, ops):
+    arr = [random.randint(0, 1000) for _ in range(n)]
+    updates = [(random.randrange(n), random.randint(0, 1000)) for _ in range(ops)]
+    queries = []
+    for _ in range(ops):
+        l = random.randrange(n)
+        queries.append((l, random.randrange(l, n)))
+
+    print(f"n = {n:,}, {ops:,} updates + {ops:,} queries")
+    print(f"{'structure':<14}{'build':>10}{'update':>10}{'query':>10}{'buffer bytes':>16}")
+    for cls in (SegmentTree, FenwickTree):
+        holder = []
+        build = timed(lambda: holder.append(cls(arr)))
+        tree = holder[0]
+
+        def do_updates():
+            for idx, value in updates:
+                tree.update(idx, value)
+
+        def do_queries():
+            for l, r in queries:
+                tree.query(l, r)
+
+        update = timed(do_updates)
+        query = timed(do_queries)
+        size = sys.getsizeof(tree.tree)
+        print(f"{cls.__name__:<14}{build:>10.3f}{update:>10.3f}{query:>10.3f}{size:>16,}")
+
+    # Both must agree on every answer
+    seg, fen = SegmentTree(arr), FenwickTree(arr)
+    assert all(seg.query(l, r) == fen.query(l, r) for l, r in queries[:1000])
+    print()
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    for n in (10_000, 1_000_000):
+        run(n, 100_000)
@@ -0,0 +1,48 @@
+from bisect import bisect_left, bisect_right
+
+from segment_tree import SegmentTree
+
+
+def compress_coordinates(keys):
+    # Map every distinct key to its rank: returns (sorted distinct keys, key -> rank)
+    coords = sorted(set(keys))
+    return coords, {key: rank for rank, key in enumerate(coords)}
+
+
+class CompressedSegmentTree:
+    # Offline alternative to DynamicSegmentTree: when every key is known up front,
+    # rank them once and keep a dense SegmentTree over the ranks.
+    # Queries may use any coordinates, not only the known keys.
+    def __init__(self, keys, values=None):
+        self.coords, self.rank = compress_coordinates(keys)
+        dense = [0] * len(self.coords)
+        if values is not None:
+            for key, value in zip(keys, values):
+                dense[self.rank[key]] += value
+        self.tree = SegmentTree(dense)
+
+    def update(self, key, value):
+        # arr[key] = value for a key passed at construction
+        if key not in self.rank:
+            raise KeyError(key)
+        self.tree.update(self.rank[key], value)
+
+    def query(self, lo, hi):
+        # Sum over every known key in [lo, hi]
+        l = bisect_left(self.coords, lo)
+        r = bisect_right(self.coords, hi) - 1
+        if l > r:
+            return 0
+        return self.tree.query(l, r)
+
+
+# Example usage
+if __name__ == "__main__":
+    timestamps = [1_000_000_000_000, 1_000_000_000_500, 3, 1_099_511_627_775]
+    amounts = [5, 7, 2, 1]
+
+    tree = CompressedSegmentTree(timestamps, amounts)
+    print("Sum in [0, 2^40):", tree.query(0, (1 << 40) - 1))  # Output: 15
+
+    tree.update(3, 10)
+    print("Sum in [0, 1e12):", tree.query(0, 999_999_999_999))  # Output: 10
@@ -0,0 +1,111 @@
+from array import array
+
+from monoid_segment_tree import make_store, split_args
+
+
+class DynamicSegmentTree:
+    # Range-sum segment tree over the coordinate range [lo, hi] that allocates
+    # nodes only on the paths that updates touch, so memory is O(updates * log U)
+    # instead of O(U). Nodes live in flat parallel arrays; child index 0 means
+    # "not allocated yet" (node 0 is the root, which is never anyone's child).
+    # total becomes a plain list once a sum passes int64 or a float reaches an int tree.
+    def __init__(self, lo, hi, typecode='q'):
+        if lo > hi:
+            raise ValueError("lo must not exceed hi")
+        self.lo = lo
+        self.hi = hi
+        self.left = array('q', [0])
+        self.right = array('q', [0])
+        self.typecode = typecode
+        self.total = make_store(1, typecode)
+
+    def _new_node(self):
+        self.left.append(0)
+        self.right.append(0)
+        self.total.append(0)
+        return len(self.left) - 1
+
+    def add(self, idx, delta):
+        # arr[idx] += delta
+        if not self.lo <= idx <= self.hi:
+            raise IndexError("index out of bounds")
+        left, right, total = self.left, self.right, self.total
+        node, lo, hi = 0, self.lo, self.hi
+        while True:
+            try:
+                total[node] += delta
+            except (OverflowError, TypeError):
+                # A rejected write leaves the node unchanged: untype and redo this node
+                if self.typecode is None:
+                    raise
+                self.typecode = None
+                self.total = total = self.total.tolist()
+                continue
+            if lo == hi:
+                return
+            mid = (lo + hi) // 2
+            if idx <= mid:
+                if not left[node]:
+                    left[node] = self._new_node()
+                node, hi = left[node], mid
+            else:
+                if not right[node]:
+                    right[node] = self._new_node()
+                node, lo = right[node], mid + 1
+
+    def get(self, idx):
+        # Current arr[idx]; untouched coordinates read as 0
+        if not self.lo <= idx <= self.hi:
+            raise IndexError("index out of bounds")
+        node, lo, hi = 0, self.lo, self.hi
+        while lo != hi:
+            mid = (lo + hi) // 2
+            if idx <= mid:
+                node, hi = self.left[node], mid
+            else:
+                node, lo = self.right[node], mid + 1
+            if not node:
+                return 0
+        return self.total[node]
+
+    def update(self, *args):
+        # update(idx, value) assigns arr[idx] = value, same call forms as SegmentTree.update
+        idx, value = split_args(args, "update")
+        self.add(idx, value - self.get(idx))
+
+    def query(self, *args):
+        # Sum of arr[l .. r], same call forms as SegmentTree.query
+        l, r = split_args(args, "query")
+        if l < self.lo or r > self.hi or l > r:
+            raise IndexError("query range out of bounds")
+        result = 0
+        stack = [(0, self.lo, self.hi)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if r < lo or hi < l:
+                continue
+            if l <= lo and hi <= r:
+                result += self.total[node]
+                continue
+            mid = (lo + hi) // 2
+            if self.left[node]:
+                stack.append((self.left[node], lo, mid))
+            if self.right[node]:
+                stack.append((self.right[node], mid + 1, hi))
+        return result
+
+    def node_count(self):
+        return len(self.left)
+
+
+# Example usage
+if __name__ == "__main__":
+    # Timestamps up to 2^40 without preallocating anything
+    tree = DynamicSegmentTree(0, (1 << 40) - 1)
+    tree.add(1_000_000_000_000, 5)
+    tree.add(1_000_000_000_500, 7)
+    tree.update(3, 2)
+
+    print("Sum in [0, 2^40):", tree.query(0, (1 << 40) - 1))  # Output: 14
+    print("Sum in [1e12, 1e12 + 100]:", tree.query(1_000_000_000_000, 1_000_000_000_100))  # Output: 5
+    print("Nodes allocated:", tree.node_count())
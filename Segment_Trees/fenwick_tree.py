@@ -0,0 +1,116 @@
+from monoid_segment_tree import make_store, pick_typecode, split_args, to_store
+
+
+class FenwickTree:
+    # Binary indexed tree for point updates and range sums.
+    # tree[i] (1-based) holds the sum of arr[i - lowbit(i) .. i - 1], so the whole
+    # structure is a single buffer of n + 1 slots. The cells are partial sums, so they can
+    # outgrow int64 while every leaf fits; the buffer then becomes a plain list (untype).
+    def __init__(self, arr, typecode=None):
+        self.n = len(arr)
+        if typecode is None:
+            typecode = pick_typecode(arr)
+        self.typecode = typecode
+        self.tree = make_store(self.n + 1, typecode)
+        self.build(arr)
+
+    def untype(self):
+        self.typecode = None
+        self.tree = self.tree.tolist()
+
+    def build(self, arr):
+        try:
+            self._build(arr)
+        except (OverflowError, TypeError):
+            if self.typecode is None:
+                raise
+            self.untype()
+            self._build(arr)
+
+    def _build(self, arr):
+        # O(n): every node pushes its total into its parent exactly once
+        n = self.n
+        tree = self.tree
+        tree[1:] = to_store(arr, self.typecode)
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+    def add(self, idx, delta):
+        # arr[idx] += delta
+        if not 0 <= idx < self.n:
+            raise IndexError("update index out of bounds")
+        tree = self.tree
+        n = self.n
+        i = idx + 1
+        while i <= n:
+            try:
+                tree[i] += delta
+            except (OverflowError, TypeError):
+                # A rejected write leaves the cell unchanged: untype and redo this cell
+                if self.typecode is None:
+                    raise
+                self.untype()
+                tree = self.tree
+                continue
+            i += i & -i
+
+    def update(self, *args):
+        # update(idx, value) assigns arr[idx] = value, same call forms as SegmentTree.update
+        idx, value = split_args(args, "update")
+        if not 0 <= idx < self.n:
+            raise IndexError("update index out of bounds")
+        self.add(idx, value - self.query(idx, idx))
+
+    def prefix_sum(self, i):
+        # Sum of arr[0 .. i - 1]
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def query(self, *args):
+        # Sum of arr[l .. r], same call forms as SegmentTree.query
+        l, r = split_args(args, "query")
+        if l < 0 or r >= self.n or l > r:
+            raise IndexError("query range out of bounds")
+        return self.prefix_sum(r + 1) - self.prefix_sum(l)
+
+    def lower_bound(self, prefix):
+        # Smallest idx with arr[0] + ... + arr[idx] >= prefix, or n if there is none.
+        # Needs every value to be non-negative so prefix sums are monotonic.
+        tree = self.tree
+        pos = 0
+        remaining = prefix
+        step = 1 << self.n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and tree[nxt] < remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def __len__(self):
+        return self.n
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+    fenwick = FenwickTree(arr)
+
+    print("Query(1,3):", fenwick.query(1, 3))  # Output: 15
+
+    fenwick.update(1, 10)
+    print("Query(1,3) after update:", fenwick.query(1, 3))  # Output: 22
+
+    # First index where the running total reaches 20: 1 + 10 + 5 + 7 = 23
+    print("lower_bound(20):", fenwick.lower_bound(20))  # Output: 3
+
+    # Partial sums past int64 move the buffer to a plain list
+    big = FenwickTree([2 ** 62, 2 ** 62])
+    print("Query(0,1):", big.query(0, 1) == 2 ** 63, big.typecode)  # Output: True None
@@ -0,0 +1,237 @@
+from operator import add
+
+from monoid_segment_tree import _INT64_MAX, make_store, pick_typecode, split_args
+
+
+class RangeUpdateSegmentTree:
+    # Non-recursive lazy propagation over a power-of-two layout.
+    # Each internal node keeps at most one pending tag: an assignment (has_assign[i])
+    # or an addition (pending_add[i]); adding on top of an assignment folds into it.
+    # scaled=True means an update of value v adds v * length to a node (sums),
+    # scaled=False means it adds v once (min/max).
+    # Tags accumulate (+=) over several nodes, so a write the typed buffer rejects halfway
+    # through cannot simply be retried. Instead `bound` tracks an upper bound on every
+    # |leaf|, |tag| and |assigned value|, and the tree switches to plain lists (untype)
+    # before an update that could push a node past int64 or put a float in an int buffer.
+    # The bound only grows between flushes: when it runs out, every tag is pushed to the
+    # leaves and it restarts from the largest actual |leaf|.
+    def __init__(self, arr, combine, identity, scaled, typecode=None):
+        self.n = len(arr)
+        self.combine = combine
+        self.identity = identity
+        self.scaled = scaled
+        if typecode is None:
+            typecode = pick_typecode(arr)
+        self.typecode = typecode
+        self.height = max(1, (self.n - 1).bit_length())
+        self.size = 1 << self.height
+        self.tree = make_store(2 * self.size, typecode)
+        self.pending_add = make_store(self.size, typecode)
+        self.assign_value = make_store(self.size, typecode)
+        self.has_assign = bytearray(self.size)
+        self.bound = 0
+        self.build(arr)
+
+    def build(self, arr):
+        size = self.size
+        combine = self.combine
+        leaves = make_store(0, self.typecode)
+        leaves.extend(arr)
+        if self.typecode == 'q' and self.n:
+            self._check(max(-min(leaves), max(leaves)), False)
+        tree = self.tree
+        tree[size:size + self.n] = leaves
+        for i in range(size - 1, 0, -1):
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+
+    def untype(self):
+        # Move every buffer to a plain list; big ints and mixed int/float values then just work
+        self.typecode = None
+        self.tree = self.tree.tolist()
+        self.pending_add = self.pending_add.tolist()
+        self.assign_value = self.assign_value.tolist()
+
+    def _check(self, value, adding):
+        # Called before value is added or assigned anywhere: untype unless it is safe to write.
+        # A node holds at most bound * its leaf count (sums) or bound itself (min/max).
+        if self.typecode is None:
+            return
+        if self.typecode == 'd':
+            if not isinstance(value, (int, float)):
+                self.untype()
+            return
+        if not isinstance(value, int):
+            self.untype()
+            return
+        limit = _INT64_MAX // (self.size if self.scaled else 1)
+        bound = self.bound + abs(value) if adding else max(self.bound, abs(value))
+        if bound > limit:
+            self._flush()
+            bound = self.bound + abs(value) if adding else max(self.bound, abs(value))
+            # Values within a factor 2 of the limit would make every update flush again
+            if bound > limit or 2 * self.bound > limit:
+                self.untype()
+                return
+        self.bound = bound
+
+    def _flush(self):
+        # Push every pending tag down to the leaves (O(n)), then bound = max |leaf|
+        for i in range(1, self.size):
+            self._push_node(i)
+        leaves = self.tree[self.size:self.size + self.n]
+        self.bound = max(-min(leaves), max(leaves)) if self.n else 0
+
+    def _length(self, i):
+        # Number of leaves under node i
+        return self.size >> (i.bit_length() - 1)
+
+    def _apply_add(self, i, delta):
+        self.tree[i] += delta * self._length(i) if self.scaled else delta
+        if i < self.size:
+            if self.has_assign[i]:
+                self.assign_value[i] += delta
+            else:
+                self.pending_add[i] += delta
+
+    def _apply_assign(self, i, value):
+        self.tree[i] = value * self._length(i) if self.scaled else value
+        if i < self.size:
+            self.has_assign[i] = 1
+            self.assign_value[i] = value
+            self.pending_add[i] = 0
+
+    def _push_node(self, i):
+        # Hand node i's pending tag to its two children
+        if self.has_assign[i]:
+            value = self.assign_value[i]
+            self._apply_assign(2 * i, value)
+            self._apply_assign(2 * i + 1, value)
+            self.has_assign[i] = 0
+        elif self.pending_add[i]:
+            delta = self.pending_add[i]
+            self._apply_add(2 * i, delta)
+            self._apply_add(2 * i + 1, delta)
+            self.pending_add[i] = 0
+
+    def _push(self, leaf):
+        # Push pending tags down the path from the root to leaf
+        for s in range(self.height, 0, -1):
+            self._push_node(leaf >> s)
+
+    def _rebuild(self, i):
+        # Recompute the ancestors of i, keeping each ancestor's own pending tag
+        tree = self.tree
+        combine = self.combine
+        while i > 1:
+            i >>= 1
+            if self.has_assign[i]:
+                value = self.assign_value[i]
+                tree[i] = value * self._length(i) if self.scaled else value
+            else:
+                delta = self.pending_add[i]
+                tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+                if delta:
+                    tree[i] += delta * self._length(i) if self.scaled else delta
+
+    def _range_apply(self, l, r, apply, value):
+        if l < 0 or r >= self.n or l > r:
+            raise IndexError("update range out of bounds")
+        self._check(value, apply == self._apply_add)
+        l += self.size
+        r += self.size + 1
+        l0, r0 = l, r - 1
+        self._push(l0)
+        self._push(r0)
+        while l < r:
+            if l & 1:
+                apply(l, value)
+                l += 1
+            if r & 1:
+                r -= 1
+                apply(r, value)
+            l >>= 1
+            r >>= 1
+        self._rebuild(l0)
+        self._rebuild(r0)
+
+    def range_add(self, l, r, delta):
+        # arr[i] += delta for every l <= i <= r
+        self._range_apply(l, r, self._apply_add, delta)
+
+    def range_assign(self, l, r, value):
+        # arr[i] = value for every l <= i <= r
+        self._range_apply(l, r, self._apply_assign, value)
+
+    def update(self, *args):
+        # Point assignment, same call forms as SegmentTree.update
+        idx, value = split_args(args, "update")
+        self.range_assign(idx, idx, value)
+
+    def query(self, *args):
+        # Same call forms as SegmentTree.query
+        l, r = split_args(args, "query")
+        if l < 0 or r >= self.n or l > r:
+            raise IndexError("query range out of bounds")
+        l += self.size
+        r += self.size + 1
+        self._push(l)
+        self._push(r - 1)
+        tree = self.tree
+        combine = self.combine
+        left = right = self.identity
+        while l < r:
+            if l & 1:
+                left = combine(left, tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                right = combine(tree[r], right)
+            l >>= 1
+            r >>= 1
+        return combine(left, right)
+
+    def __len__(self):
+        return self.n
+
+
+class LazySegmentTree(RangeUpdateSegmentTree):
+    def __init__(self, arr, typecode=None):
+        super().__init__(arr, add, 0, True, typecode)
+
+
+class LazySegmentTreeMin(RangeUpdateSegmentTree):
+    def __init__(self, arr, typecode=None):
+        super().__init__(arr, min, float('inf'), False, typecode)
+
+
+class LazySegmentTreeMax(RangeUpdateSegmentTree):
+    def __init__(self, arr, typecode=None):
+        super().__init__(arr, max, float('-inf'), False, typecode)
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+
+    sum_tree = LazySegmentTree(arr)
+    sum_tree.range_add(1, 4, 10)
+    print("Sum in [0, 5]:", sum_tree.query(0, 5))  # Output: 76
+    sum_tree.range_assign(2, 3, 0)
+    print("Sum in [1, 4]:", sum_tree.query(1, 4))  # Output: 32
+
+    max_tree = LazySegmentTreeMax(arr)
+    max_tree.range_add(0, 2, 100)
+    print("Max in [0, 5]:", max_tree.query(0, 5))  # Output: 105
+
+    min_tree = LazySegmentTreeMin(arr)
+    min_tree.range_assign(0, 3, 20)
+    print("Min in [0, 5]:", min_tree.query(0, 5))  # Output: 9
+
+    # Sums past int64 and float deltas switch the buffers to plain lists
+    big_tree = LazySegmentTree([2 ** 62, 2 ** 62])
+    big_tree.range_add(0, 1, 1)
+    print("Sum in [0, 1]:", big_tree.query(0, 1) == 2 ** 63 + 2, big_tree.typecode)  # Output: True None
+
+    half_tree = LazySegmentTree([1, 2, 3])
+    half_tree.range_add(0, 2, 0.5)
+    print("Sum in [0, 2]:", half_tree.query(0, 2))  # Output: 7.5
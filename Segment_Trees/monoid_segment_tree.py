@@ -0,0 +1,283 @@
+from array import array
+from math import gcd
+from operator import add, and_, mul, or_, xor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+# A float64 shadow of an int64 result this large may have wrapped (2^62 leaves room for rounding)
+_FLOAT_SAFE = float(1 << 62)
+
+# Combines whose result can outgrow their inputs; batched int64 results are checked for these
+_GROWING = (add, mul)
+
+
+# Vectorized twins of the common combine functions, used by the batched calls
+_UFUNCS = {} if np is None else {
+    add: np.add,
+    mul: np.multiply,
+    min: np.minimum,
+    max: np.maximum,
+    gcd: np.gcd,
+    xor: np.bitwise_xor,
+    or_: np.bitwise_or,
+    and_: np.bitwise_and,
+}
+
+
+def pick_typecode(values):
+    # 'q' for 64-bit ints, 'd' for floats, None when only a plain list will do.
+    # Only the leaves are looked at: the trees switch to a list later (untype) if a
+    # combined value or an update no longer fits.
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None:
+        if dtype.kind == 'u' and len(values) and int(values.max()) > _INT64_MAX:
+            return None
+        return {'i': 'q', 'u': 'q', 'f': 'd'}.get(dtype.kind)
+    typecode = 'q'
+    for v in values:
+        if isinstance(v, bool):
+            return None
+        if isinstance(v, int):
+            if not _INT64_MIN <= v <= _INT64_MAX:
+                return None
+        elif isinstance(v, float):
+            typecode = 'd'
+        else:
+            return None
+    return typecode
+
+
+def make_store(size, typecode, fill=0):
+    if typecode is None:
+        return [fill] * size
+    return array(typecode, [fill]) * size
+
+
+def to_store(values, typecode):
+    # Copy values into a fresh list/array buffer without a per-element loop for NumPy input
+    if typecode is None:
+        if np is not None and isinstance(values, np.ndarray):
+            return values.tolist()
+        return list(values)
+    if np is not None and isinstance(values, np.ndarray):
+        store = array(typecode)
+        store.frombytes(np.ascontiguousarray(values, dtype=typecode).tobytes())
+        return store
+    return array(typecode, values)
+
+
+def split_args(args, name):
+    # Accept both the flat (a, b) call and the recursive (node, start, end, a, b) call
+    if len(args) == 5:
+        return args[3:]
+    if len(args) != 2:
+        raise TypeError(name + " expects 2 arguments or the (node, start, end, ...) form")
+    return args
+
+
+class MonoidSegmentTree:
+    # Bottom-up segment tree over a flat buffer of size 2n.
+    # Leaves live at tree[n + i]; node i combines tree[2i] and tree[2i + 1].
+    # combine must be associative and identity must satisfy combine(identity, x) == x.
+    # ufunc is the NumPy equivalent of combine; it is looked up automatically for
+    # add/mul/min/max/gcd/xor/or/and and only needed for query_many/update_many.
+    def __init__(self, arr, combine, identity, typecode=None, ufunc=None):
+        self.n = len(arr)
+        self.combine = combine
+        self.identity = identity
+        self.ufunc = ufunc if ufunc is not None else _UFUNCS.get(combine)
+        if typecode is None:
+            typecode = pick_typecode(arr)
+        self.typecode = typecode
+        self.tree = make_store(2 * self.n, typecode)
+        self.build(arr)
+
+    def untype(self):
+        # Switch to a plain list once a value (a sum past int64, a float in an int tree) no longer fits
+        self.typecode = None
+        self.tree = self.tree.tolist()
+
+    def _widening(self, write, *args):
+        # Run write; if the typed buffer rejects a value, untype and run it again.
+        # Both writes below are safe to repeat: they only assign, never accumulate.
+        try:
+            write(*args)
+        except (OverflowError, TypeError):
+            if self.typecode is None:
+                raise
+            self.untype()
+            write(*args)
+
+    def build(self, arr):
+        self._widening(self._build, arr)
+
+    def _build(self, arr):
+        n = self.n
+        tree = self.tree
+        combine = self.combine
+        tree[n:] = to_store(arr, self.typecode)
+        for i in range(n - 1, 0, -1):
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+
+    def query(self, *args):
+        # query(l, r) over the inclusive range [l, r]; l > r is an IndexError like an out-of-bounds range.
+        # The recursive form query(node, start, end, l, r) is still accepted.
+        l, r = split_args(args, "query")
+        if l < 0 or r >= self.n or l > r:
+            raise IndexError("query range out of bounds")
+        tree = self.tree
+        combine = self.combine
+        left = right = self.identity
+        l += self.n
+        r += self.n + 1
+        while l < r:
+            if l & 1:
+                left = combine(left, tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                right = combine(tree[r], right)
+            l >>= 1
+            r >>= 1
+        return combine(left, right)
+
+    def update(self, *args):
+        # update(idx, value) assigns arr[idx] = value.
+        # The recursive form update(node, start, end, idx, value) is still accepted.
+        idx, value = split_args(args, "update")
+        if not 0 <= idx < self.n:
+            raise IndexError("update index out of bounds")
+        self._widening(self._set, idx, value)
+
+    def _set(self, idx, value):
+        tree = self.tree
+        combine = self.combine
+        i = idx + self.n
+        tree[i] = value
+        i >>= 1
+        while i:
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def _numpy_view(self):
+        # Zero-copy NumPy view of the typed buffer, or None when batching must fall back to a loop
+        if np is None:
+            raise ImportError("query_many/update_many need NumPy")
+        if self.typecode is None or self.ufunc is None or self.n == 0:
+            return None
+        return np.frombuffer(self.tree, dtype=self.typecode)
+
+    def _batch_identity(self, dtype):
+        # ±inf is the identity for min/max but does not fit an integer dtype; the dtype bounds do
+        identity = self.identity
+        if dtype.kind == 'i' and isinstance(identity, float):
+            info = np.iinfo(dtype)
+            return info.max if identity > 0 else info.min
+        return identity
+
+    def query_many(self, ls, rs):
+        # Answer every query(ls[k], rs[k]) at once; returns a NumPy array.
+        # All queries climb the tree together, one vectorized pass per level.
+        # int64 arithmetic wraps silently, so for add/mul an answer that may not fit is
+        # recomputed with query() and the result becomes an object array.
+        tree = self._numpy_view()
+        ls = np.asarray(ls, dtype=np.int64)
+        rs = np.asarray(rs, dtype=np.int64)
+        if ls.shape != rs.shape:
+            raise ValueError("ls and rs must have the same length")
+        if ls.size and (ls.min() < 0 or rs.max() >= self.n or (ls > rs).any()):
+            raise IndexError("query range out of bounds")
+        if tree is None:
+            return np.array([self.query(int(l), int(r)) for l, r in zip(ls, rs)])
+        result = self._climb(tree, ls, rs, tree.dtype)
+        if tree.dtype.kind == 'i' and self.combine in _GROWING:
+            # Every stored node fits int64, but a sum or product of several can wrap.
+            # Redo the climb in float64 and answer the suspicious queries exactly.
+            shadow = self._climb(tree, ls, rs, np.float64)
+            suspect = np.flatnonzero(~(np.abs(shadow) < _FLOAT_SAFE))
+            if suspect.size:
+                result = result.astype(object)
+                for k in suspect.tolist():
+                    result[k] = self.query(int(ls[k]), int(rs[k]))
+        return result
+
+    def _climb(self, tree, ls, rs, dtype):
+        # The vectorized query loop, accumulating in dtype
+        ufunc = self.ufunc
+        identity = self._batch_identity(np.dtype(dtype))
+        left = np.full(ls.shape, identity, dtype=dtype)
+        right = left.copy()
+        l = ls + self.n
+        r = rs + self.n + 1
+        active = l < r
+        while active.any():
+            take = active & (l & 1 == 1)
+            left[take] = ufunc(left[take], tree[l[take]])
+            l += take
+            take = active & (r & 1 == 1)
+            r -= take
+            right[take] = ufunc(tree[r[take]], right[take])
+            l >>= 1
+            r >>= 1
+            active = l < r
+        return ufunc(left, right)
+
+    def update_many(self, idxs, values):
+        # Apply every update(idxs[k], values[k]); for repeated indices the last value wins.
+        # Each level of touched ancestors is recomputed in a single vectorized pass.
+        # Values that would be truncated or wrap in int64 switch the tree to a list, like update().
+        tree = self._numpy_view()
+        idxs = np.asarray(idxs, dtype=np.int64)
+        if idxs.size and (idxs.min() < 0 or idxs.max() >= self.n):
+            raise IndexError("update index out of bounds")
+        values = np.asarray(values)
+        if values.shape != idxs.shape:
+            raise ValueError("idxs and values must have the same length")
+        # Values the buffer cannot hold exactly (floats or big ints in an int tree, ...)
+        # go through update() one by one, which switches the tree to a list like update does
+        if tree is None or not np.can_cast(values.dtype, tree.dtype, casting='safe'):
+            for idx, value in zip(idxs.tolist(), values.tolist()):
+                self.update(idx, value)
+            return
+        # Keep only the last write to each index
+        nodes, last = np.unique(idxs[::-1], return_index=True)
+        tree[nodes + self.n] = values[::-1][last]
+        ufunc = self.ufunc
+        check = tree.dtype.kind == 'i' and self.combine in _GROWING
+        nodes = np.unique((nodes + self.n) >> 1)
+        while nodes.size:
+            nodes = nodes[nodes > 0]
+            lo, hi = tree[2 * nodes], tree[2 * nodes + 1]
+            if check and not (np.abs(ufunc(lo.astype(np.float64), hi)) < _FLOAT_SAFE).all():
+                # A parent would wrap: untype and recombine every level in Python
+                self.untype()
+                for i in range(self.n - 1, 0, -1):
+                    self.tree[i] = self.combine(self.tree[2 * i], self.tree[2 * i + 1])
+                return
+            tree[nodes] = ufunc(lo, hi)
+            nodes = np.unique(nodes >> 1)
+
+    def __len__(self):
+        return self.n
+
+
+if __name__ == "__main__":
+    arr = [12, 18, 24, 6, 30, 9]
+
+    gcd_tree = MonoidSegmentTree(arr, gcd, 0)
+    print("GCD in [0, 3]:", gcd_tree.query(0, 3))  # Output: 6
+
+    xor_tree = MonoidSegmentTree(arr, xor, 0)
+    print("XOR in [1, 2]:", xor_tree.query(1, 2))  # Output: 10
+
+    xor_tree.update(2, 18)
+    print("XOR in [1, 2] after update:", xor_tree.query(1, 2))  # Output: 0
+
+    # Products outgrow int64: the tree moves from array('q') to a plain list instead of failing
+    product_tree = MonoidSegmentTree([10] * 20, mul, 1)
+    print("Product in [0, 19]:", product_tree.query(0, 19) == 10 ** 20, product_tree.typecode)  # Output: True None
@@ -0,0 +1,130 @@
+from array import array
+
+from monoid_segment_tree import make_store, pick_typecode
+
+
+class PersistentSegmentTree:
+    # Range-sum segment tree that keeps every version.
+    # Nodes live in flat parallel arrays (left, right, total); an update copies only
+    # the O(log n) nodes on the root-to-leaf path and shares everything else.
+    # roots[v] is the root node of version v; version 0 is the initial array.
+    # Totals are sums, so they can pass int64 while the values fit; `total` then
+    # becomes a plain list.
+    def __init__(self, arr, typecode=None):
+        self.n = len(arr)
+        if self.n == 0:
+            raise ValueError("PersistentSegmentTree needs a non-empty array")
+        if typecode is None:
+            typecode = pick_typecode(arr)
+        self.typecode = typecode
+        self.left = array('q')
+        self.right = array('q')
+        self.total = make_store(0, typecode)
+        self.roots = array('q', [self.build(arr)])
+
+    def _new_node(self, left, right, total):
+        # total goes first, so a value the typed buffer rejects leaves the three arrays aligned
+        try:
+            self.total.append(total)
+        except (OverflowError, TypeError):
+            if self.typecode is None:
+                raise
+            self.typecode = None
+            self.total = self.total.tolist()
+            self.total.append(total)
+        self.left.append(left)
+        self.right.append(right)
+        return len(self.left) - 1
+
+    def _root(self, version):
+        # roots[-1] would quietly answer for the newest version, so check the range
+        if not 0 <= version < len(self.roots):
+            raise IndexError("version {} does not exist".format(version))
+        return self.roots[version]
+
+    def build(self, arr):
+        # Post-order build with an explicit stack; returns the root node
+        stack = [(0, self.n - 1, False)]
+        built = []
+        while stack:
+            lo, hi, children_done = stack.pop()
+            if lo == hi:
+                built.append(self._new_node(-1, -1, arr[lo]))
+            elif children_done:
+                right = built.pop()
+                left = built.pop()
+                built.append(self._new_node(left, right, self.total[left] + self.total[right]))
+            else:
+                mid = (lo + hi) // 2
+                stack.append((lo, hi, True))
+                stack.append((mid + 1, hi, False))
+                stack.append((lo, mid, False))
+        return built[0]
+
+    def update(self, version, idx, value):
+        # Set arr[idx] = value on top of `version`; returns the new version number
+        if not 0 <= idx < self.n:
+            raise IndexError("update index out of bounds")
+        node = self._root(version)
+        lo, hi = 0, self.n - 1
+        path = []
+        while lo != hi:
+            mid = (lo + hi) // 2
+            path.append(node)
+            if idx <= mid:
+                node = self.left[node]
+                hi = mid
+            else:
+                node = self.right[node]
+                lo = mid + 1
+        child = self._new_node(-1, -1, value)
+        # Copy the path bottom-up, swapping in the fresh child each time
+        for old in reversed(path):
+            left, right = self.left[old], self.right[old]
+            if left == node:
+                left = child
+            else:
+                right = child
+            node = old
+            child = self._new_node(left, right, self.total[left] + self.total[right])
+        self.roots.append(child)
+        return len(self.roots) - 1
+
+    def query(self, version, l, r):
+        # Sum of arr[l .. r] as it was in `version`
+        if l < 0 or r >= self.n or l > r:
+            raise IndexError("query range out of bounds")
+        total = 0
+        stack = [(self._root(version), 0, self.n - 1)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if r < lo or hi < l:
+                continue
+            if l <= lo and hi <= r:
+                total += self.total[node]
+                continue
+            mid = (lo + hi) // 2
+            stack.append((self.left[node], lo, mid))
+            stack.append((self.right[node], mid + 1, hi))
+        return total
+
+    def __len__(self):
+        return self.n
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+    pst = PersistentSegmentTree(arr)
+
+    v1 = pst.update(0, 1, 10)   # arr[1] = 10
+    v2 = pst.update(v1, 4, 0)   # arr[4] = 0
+
+    print("Version 0, sum [1, 4]:", pst.query(0, 1, 4))   # Output: 24
+    print("Version 1, sum [1, 4]:", pst.query(v1, 1, 4))  # Output: 31
+    print("Version 2, sum [1, 4]:", pst.query(v2, 1, 4))  # Output: 22
+
+    # A total past int64 moves the totals to a plain list
+    big = PersistentSegmentTree([2 ** 62, 2 ** 62])
+    v1 = big.update(0, 0, 1)
+    print("Sums:", big.query(0, 0, 1) == 2 ** 63, big.query(v1, 0, 1) == 2 ** 62 + 1)  # Output: True True
@@ -0,0 +1,95 @@
+from monoid_segment_tree import split_args
+from range_max_st import SegmentTreeMax
+from range_min_st import SegmentTreeMin
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SparseTable:
+    # Static range min/max. Row k holds the answer for every window of length 2^k,
+    # so any [l, r] is covered by two (possibly overlapping) windows: O(1) per query.
+    # Only idempotent operations (min, max) may overlap like that.
+    def __init__(self, arr, mode='min'):
+        if mode not in ('min', 'max'):
+            raise ValueError("mode must be 'min' or 'max'")
+        if np is None:
+            raise ImportError("SparseTable needs NumPy")
+        self.mode = mode
+        self.ufunc = np.minimum if mode == 'min' else np.maximum
+        values = np.asarray(arr)
+        if values.dtype.kind not in 'biufmM':
+            # Ints past 64 bits, Fractions, strings ...: object rows keep them exact,
+            # np.minimum / np.maximum then compare the Python objects
+            values = values.astype(object)
+        self.n = len(values)
+        self.levels = [values.copy()]
+        self.build()
+
+    def build(self):
+        # O(n log n): each row is one vectorized pass over the previous row
+        ufunc = self.ufunc
+        k = 1
+        while (1 << k) <= self.n:
+            prev = self.levels[-1]
+            half = 1 << (k - 1)
+            self.levels.append(ufunc(prev[:-half], prev[half:]))
+            k += 1
+
+    def query(self, *args):
+        # Same call forms as SegmentTreeMin.query / SegmentTreeMax.query
+        l, r = split_args(args, "query")
+        if l < 0 or r >= self.n or l > r:
+            raise IndexError("query range out of bounds")
+        k = (r - l + 1).bit_length() - 1
+        row = self.levels[k]
+        a = row[l]
+        b = row[r - (1 << k) + 1]
+        result = min(a, b) if self.mode == 'min' else max(a, b)
+        return result.item() if isinstance(result, np.generic) else result
+
+    def query_many(self, ls, rs):
+        # Answer every query(ls[i], rs[i]) with a handful of vectorized gathers
+        ls = np.asarray(ls, dtype=np.int64)
+        rs = np.asarray(rs, dtype=np.int64)
+        if ls.shape != rs.shape:
+            raise ValueError("ls and rs must have the same length")
+        if ls.size and (ls.min() < 0 or rs.max() >= self.n or (ls > rs).any()):
+            raise IndexError("query range out of bounds")
+        result = np.empty(ls.shape, dtype=self.levels[0].dtype)
+        # floor(log2(length)), exact for lengths up to 2^53
+        _, exponents = np.frexp(rs - ls + 1)
+        ks = exponents.astype(np.int64) - 1
+        for k in np.unique(ks).tolist():
+            pick = ks == k
+            row = self.levels[k]
+            result[pick] = self.ufunc(row[ls[pick]], row[rs[pick] - (1 << k) + 1])
+        return result
+
+    def __len__(self):
+        return self.n
+
+
+def range_query_structure(arr, mode='min', immutable=False):
+    # Static data gets the O(1)-query sparse table; data that will be updated
+    # gets the O(log n) segment tree, which supports update().
+    if mode not in ('min', 'max'):
+        raise ValueError("mode must be 'min' or 'max'")
+    if immutable and np is not None:
+        return SparseTable(arr, mode)
+    return SegmentTreeMin(arr) if mode == 'min' else SegmentTreeMax(arr)
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [4, 2, 1, 5, 3, 8, 6]
+
+    table = range_query_structure(arr, 'min', immutable=True)
+    print("Min in [1, 3]:", table.query(1, 3))  # Output: 1
+    print("Batch:", table.query_many([0, 3, 4], [6, 4, 6]))  # Output: [1 3 3]
+
+    tree = range_query_structure(arr, 'max')
+    tree.update(2, 10)
+    print("Max in [1, 3] after update:", tree.query(1, 3))  # Output: 10
@@ -1,7 +1,4 @@
-class Node:
-    def __init__(self, data):
-        self.data = data #Store the data of the node
-        self.next = None #Reference to the next node in the stack
+from nodes import DataNode as Node #data and next (the node below it in the stack)
 
 class Stack:
     def __init__(self):
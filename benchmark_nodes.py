@@ -0,0 +1,119 @@
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for folder in ('Linked_List', 'Queue', 'Stack', 'Binary_Search_Tree'):
+    sys.path.append(os.path.join(ROOT, folder))
+
+import doubly_ll
+import linked_list_queue
+import linkedlist
+import search_tree_implementation
+import stack_using_linked_list
+
+
+# The node classes as they were before nodes.py: plain classes with a per-instance __dict__
+class DictDataNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class DictDoublyDataNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+class DictDoublyListNode:
+    def __init__(self, val):
+        self.val = val
+        self.prev = None
+        self.next = None
+
+
+class DictValueTreeNode:
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+
+
+def build_linked_list(values):
+    ll = linkedlist.LinkedList()
+    for value in values:
+        ll.push_back(value)
+    return ll
+
+
+def build_doubly_list(values):
+    dll = doubly_ll.DoublyLinkedList()
+    for value in values:
+        dll.push_front(value)
+    return dll
+
+
+def build_queue(values):
+    queue = linked_list_queue.Queue()
+    for value in values:
+        queue.enqueue(value)
+    return queue
+
+
+def build_stack(values):
+    stack = stack_using_linked_list.Stack()
+    for value in values:
+        stack.push(value)
+    return stack
+
+
+def build_bst(values):
+    return search_tree_implementation.build_bst(values)
+
+
+# (structure, module whose Node is swapped, legacy node class, builder)
+STRUCTURES = [
+    ("linkedlist.LinkedList", linkedlist, DictDoublyDataNode, build_linked_list),
+    ("doubly_ll.DoublyLinkedList", doubly_ll, DictDoublyListNode, build_doubly_list),
+    ("linked_list_queue.Queue", linked_list_queue, DictDataNode, build_queue),
+    ("stack_using_linked_list.Stack", stack_using_linked_list, DictDataNode, build_stack),
+    ("search_tree_implementation", search_tree_implementation, DictValueTreeNode, build_bst),
+]
+
+
+def measure(build, values):
+    # Bytes allocated while building; the values exist beforehand, so only nodes are counted
+    tracemalloc.start()
+    structure = build(values)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return size
+
+
+def run(n):
+    values = list(range(n))
+    random.seed(1)
+    shuffled = random.sample(values, n)
+    print(f"n = {n:,} elements")
+    print(f"{'structure':<32}{'before B/elem':>15}{'after B/elem':>14}{'saved':>8}")
+    for name, module, legacy, build in STRUCTURES:
+        data = shuffled if build is build_bst else values
+        slotted = module.Node
+        module.Node = legacy
+        try:
+            before = measure(build, data)
+        finally:
+            module.Node = slotted
+        after = measure(build, data)
+        print(f"{name:<32}{before / n:>15.1f}{after / n:>14.1f}{1 - after / before:>8.0%}")
+    print()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000]
+    for n in sizes:
+        run(n)
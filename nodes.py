@@ -0,0 +1,59 @@
+# Shared node classes for the linked lists, queues, stacks and trees in this repo.
+# Every class declares __slots__, so a node is a fixed-size object with no per-instance
+# __dict__ (roughly half the memory of a plain class). Subclasses that only add
+# behaviour must declare __slots__ = () or they get a __dict__ back.
+
+
+class Node:
+    __slots__ = ()
+
+
+class DataNode(Node):
+    # Singly linked node with .data (linkedlist-style lists, Queue, Stack)
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+
+class DoublyDataNode(DataNode):
+    __slots__ = ('prev',)
+
+    def __init__(self, data, prev=None, next=None):
+        self.data = data
+        self.next = next
+        self.prev = prev
+
+
+class ListNode(Node):
+    # Singly linked node with .val (LeetCode-style helpers: cycles, sorting, reordering)
+    __slots__ = ('val', 'next')
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+class DoublyListNode(ListNode):
+    __slots__ = ('prev',)
+
+    def __init__(self, val=0, prev=None, next=None):
+        self.val = val
+        self.next = next
+        self.prev = prev
+
+
+class BinaryNode(Node):
+    # Just the two child links; subclasses add the slot that names their value
+    __slots__ = ('left', 'right')
+
+
+class TreeNode(BinaryNode):
+    # Binary tree node
+    __slots__ = ('val',)
+
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right